@@ -12,28 +12,283 @@ custom modes without writing any Python code.
 
 from __future__ import annotations
 
+import copy
 import logging
+import os
 import re
+import sys
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-import yaml
-
-if TYPE_CHECKING:
-    from amplifier_core.models import HookResult
+from amplifier_core.models import HookResult
 
 logger = logging.getLogger(__name__)
 
+# Shared require_approval_tools value when no mode is active
+_NO_APPROVAL_TOOLS: frozenset[str] = frozenset()
+
+# PyYAML is imported on first parse; see _get_yaml()
+_yaml: Any = None
+_YAML_LOADER: Any = None
+
+
+def _get_yaml() -> Any:
+    """Import PyYAML on first use and pick the fastest safe loader.
+
+    Prefers the libyaml-backed CSafeLoader (~10x faster), falling back to the
+    pure-Python SafeLoader when libyaml is unavailable.
+    """
+    global _yaml, _YAML_LOADER
+    if _yaml is None:
+        import yaml
+
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _yaml = yaml
+    return _yaml
+
+
 _SHORTCUT_PATTERN = r"^[a-z][a-z0-9_-]*$"
 _SHORTCUT_RE = re.compile(_SHORTCUT_PATTERN)
 
 
+def _split_frontmatter(data: bytes) -> tuple[bytes, bytes] | None:
+    """Split ``---`` delimited YAML frontmatter from the markdown body.
+
+    Works on the raw file bytes with plain ``find`` scans rather than a
+    DOTALL regex. Delimiter lines may carry trailing whitespace (including
+    ``\\r`` from CRLF files). Returns ``(yaml_bytes, body_bytes)`` or None if
+    there is no frontmatter.
+    """
+    if not data.startswith(b"---"):
+        return None
+    start = data.find(b"\n", 3)
+    if start < 0 or data[3:start].strip():
+        return None
+
+    end = data.find(b"\n---", start)
+    while end >= 0:
+        line_end = data.find(b"\n", end + 4)
+        if line_end < 0:
+            return None
+        if not data[end + 4 : line_end].strip():
+            return data[start + 1 : end], data[line_end + 1 :]
+        end = data.find(b"\n---", end + 4)
+    return None
+
+
+# "key:" or "key: value" line in the frontmatter subset handled by
+# _load_simple_frontmatter()
+_SIMPLE_KEY_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?\Z")
+
+
+class _NotSimpleYAML(Exception):
+    """Frontmatter uses YAML beyond what _load_simple_frontmatter() handles."""
+
+
+def _load_simple_frontmatter(data: bytes) -> dict[str, Any] | None:
+    """Load frontmatter written in the small YAML subset mode files use.
+
+    Mode frontmatter is a few nested block mappings of plain or simply quoted
+    strings, plus block (``- item``) or flow (``[a, b]``) lists of them.
+    Reading that shape line by line is several times faster than a full YAML
+    load, even through CSafeLoader. Anything outside it (other scalar types,
+    escapes, comments after values, anchors, multi-line scalars, tabs, ...)
+    returns None so the caller falls back to the real YAML loader; whatever
+    this returns is what that loader would have produced.
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+    if "\t" in text:
+        return None
+    lines: list[tuple[int, str]] = []
+    for raw in text.split("\n"):
+        content = raw.lstrip(" ").rstrip(" \r")
+        if not content or content[0] == "#":
+            continue
+        if not content.isprintable():  # control characters
+            return None
+        lines.append((len(raw) - len(raw.lstrip(" ")), content))
+    if not lines:
+        return None
+
+    try:
+        parsed, end = _parse_simple_mapping(lines, 0, lines[0][0])
+    except _NotSimpleYAML:
+        return None
+    return parsed if end == len(lines) else None
+
+
+def _parse_simple_mapping(
+    lines: list[tuple[int, str]], i: int, indent: int
+) -> tuple[dict[str, Any], int]:
+    """Parse the block mapping whose keys sit at `indent`, from line `i`."""
+    mapping: dict[str, Any] = {}
+    while i < len(lines) and lines[i][0] == indent:
+        match = _SIMPLE_KEY_RE.match(lines[i][1])
+        if match is None:
+            raise _NotSimpleYAML
+        key, value = match.groups()
+        _check_plain_str(key)
+        i += 1
+        if value:
+            mapping[key] = _parse_simple_value(value)
+        elif i < len(lines) and _is_simple_item(lines[i][1]) and lines[i][0] >= indent:
+            mapping[key], i = _parse_simple_sequence(lines, i, lines[i][0])
+        elif i < len(lines) and lines[i][0] > indent:
+            mapping[key], i = _parse_simple_mapping(lines, i, lines[i][0])
+        else:
+            raise _NotSimpleYAML  # null value
+    if i < len(lines) and lines[i][0] > indent:
+        raise _NotSimpleYAML
+    return mapping, i
+
+
+def _parse_simple_sequence(
+    lines: list[tuple[int, str]], i: int, indent: int
+) -> tuple[list[str], int]:
+    """Parse the ``- item`` block sequence at `indent`, from line `i`."""
+    items: list[str] = []
+    while i < len(lines) and lines[i][0] == indent and _is_simple_item(lines[i][1]):
+        items.append(_parse_simple_scalar(lines[i][1][1:].lstrip(" ")))
+        i += 1
+    if i < len(lines) and lines[i][0] > indent:
+        raise _NotSimpleYAML
+    return items, i
+
+
+def _is_simple_item(content: str) -> bool:
+    return content == "-" or content.startswith("- ")
+
+
+def _parse_simple_value(value: str) -> str | list[str]:
+    """Parse an inline mapping value: a string or a flow list of strings."""
+    if value[0] != "[":
+        return _parse_simple_scalar(value)
+    if value[-1] != "]":
+        raise _NotSimpleYAML
+    inner = value[1:-1].strip()
+    if not inner:
+        return []
+    return [_parse_simple_scalar(item.strip(), flow=True) for item in inner.split(",")]
+
+
+def _parse_simple_scalar(value: str, flow: bool = False) -> str:
+    """Parse a single-line scalar that YAML would load as a string."""
+    if not value:
+        raise _NotSimpleYAML  # null
+    quote = value[0]
+    if quote == '"' or quote == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != quote or quote in inner or "\\" in inner:
+            raise _NotSimpleYAML
+        return inner
+    if (
+        not (value[0].isalnum() or value[0] == "_")
+        or "#" in value
+        or ": " in value
+        or value[-1] == ":"
+        or (flow and (":" in value or any(c in value for c in "[]{}")))
+    ):
+        raise _NotSimpleYAML
+    _check_plain_str(value)
+    return value
+
+
+def _check_plain_str(value: str) -> None:
+    """Reject plain scalars YAML would resolve to a non-string (bool, int, ...)."""
+    _get_yaml()
+    for _tag, regexp in _YAML_LOADER.yaml_implicit_resolvers.get(value[0], ()):
+        if regexp.match(value):
+            raise _NotSimpleYAML
+
+
+def _read_file(path: Path) -> bytes:
+    """Read a whole file with raw ``os`` calls.
+
+    Skips the FileIO/BufferedReader pair that ``Path.read_bytes()`` builds.
+    Mode files are small, so this is normally one open, fstat, read, close.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        remaining = os.fstat(fd).st_size
+        chunks: list[bytes] = []
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _scan_mode_files(directory: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield the ``*.md`` file entries directly inside `directory`.
+
+    Uses a single ``os.scandir`` pass; ``DirEntry.is_file()`` answers from
+    the cached directory read, so no per-file stat is needed except for
+    symlinks. A missing or unreadable directory yields no entries.
+    """
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.name.endswith(".md") and entry.is_file():
+                yield entry
+
+
+def _sources_unchanged(sources: Sequence[tuple[Path, int, int]]) -> bool:
+    """True iff every ``(path, st_mtime_ns, st_size)`` still matches on disk."""
+    for path, mtime_ns, size in sources:
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        if st.st_mtime_ns != mtime_ns or st.st_size != size:
+            return False
+    return True
+
+
 def _is_valid_shortcut(value: str) -> bool:
     """True iff `value` matches the shortcut identifier grammar (see design §7.3)."""
     return bool(_SHORTCUT_RE.match(value))
 
 
+def _tool_list(file_path: Path, key: str, raw: Any) -> list[str]:
+    """Normalize a ``tools.<key>`` entry to a list of tool names.
+
+    A non-list value logs a WARNING and becomes ``[]``; non-string items are
+    dropped with a WARNING. The mode still loads either way.
+    """
+    if raw is None:
+        return []
+    if not isinstance(raw, list):
+        logger.warning(
+            "Mode file %s: tools.%s must be a list of tool names, got %r; ignoring it.",
+            file_path,
+            key,
+            raw,
+        )
+        return []
+    tools = [tool for tool in raw if isinstance(tool, str)]
+    if len(tools) != len(raw):
+        logger.warning(
+            "Mode file %s: tools.%s entries must be strings; dropping %r.",
+            file_path,
+            key,
+            [tool for tool in raw if not isinstance(tool, str)],
+        )
+    return tools
+
+
 @dataclass
 class ModeDefinition:
     """Parsed mode definition from a mode file."""
@@ -51,6 +306,37 @@ class ModeDefinition:
     allowed_transitions: list[str] | None = None  # None = any transition allowed
     allow_clear: bool = True  # False = mode(clear) denied
 
+    # Tool name -> "safe" | "block" | "confirm" | "warn", built once at
+    # construction. A tool listed more than once resolves by the precedence
+    # safe > block > confirm > warn.
+    _policy: dict[str, str] = field(init=False, repr=False, compare=False)
+    # Approval-hook view of confirm_tools (see ModeHooks._get_active_mode)
+    _confirm_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    # "<name>:" prefix for ModeHooks.warned_tools keys
+    _warn_prefix: str = field(init=False, repr=False, compare=False)
+    # Injection block built by ModeHooks.handle_provider_request on first use,
+    # and the (path, st_mtime_ns, st_size) of each @-mentioned file read into it
+    _rendered_context: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _rendered_sources: tuple[tuple[Path, int, int], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Lowest precedence first so higher-precedence lists overwrite
+        policy: dict[str, str] = {}
+        for action, tools in (
+            ("warn", self.warn_tools),
+            ("confirm", self.confirm_tools),
+            ("block", self.block_tools),
+            ("safe", self.safe_tools),
+        ):
+            policy.update(dict.fromkeys(tools or (), action))
+        self._policy = policy
+        self._confirm_set = frozenset(self.confirm_tools or ())
+        self._warn_prefix = f"{self.name}:"
+
 
 def parse_mode_file(file_path: Path) -> ModeDefinition | None:
     """Parse a mode definition from a markdown file with YAML frontmatter.
@@ -94,34 +380,53 @@ def parse_mode_file(file_path: Path) -> ModeDefinition | None:
     ---
     """
     try:
-        content = file_path.read_text(encoding="utf-8")
-    except Exception as e:
+        data = _read_file(file_path)
+    except OSError as e:
         logger.warning(f"Failed to read mode file {file_path}: {e}")
         return None
 
-    # Parse YAML frontmatter
-    frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)$", content, re.DOTALL)
-    if not frontmatter_match:
+    # Parse YAML frontmatter. The YAML bytes go straight to the loader (which
+    # decodes UTF-8 itself); only the markdown body is decoded here.
+    frontmatter = _split_frontmatter(data)
+    if frontmatter is None:
         logger.warning(f"Mode file {file_path} missing YAML frontmatter")
         return None
 
-    yaml_content = frontmatter_match.group(1)
-    markdown_body = frontmatter_match.group(2).strip()
-
+    yaml_content, body_bytes = frontmatter
     try:
-        parsed = yaml.safe_load(yaml_content)
-    except yaml.YAMLError as e:
-        logger.warning(f"Invalid YAML in mode file {file_path}: {e}")
+        markdown_body = body_bytes.decode("utf-8").strip()
+    except UnicodeDecodeError as e:
+        logger.warning(f"Failed to read mode file {file_path}: {e}")
         return None
 
+    parsed = _load_simple_frontmatter(yaml_content)
+    if parsed is None:
+        yaml = _get_yaml()
+        try:
+            parsed = yaml.load(yaml_content, Loader=_YAML_LOADER)
+        except yaml.YAMLError as e:
+            logger.warning(f"Invalid YAML in mode file {file_path}: {e}")
+            return None
+
     if not parsed or "mode" not in parsed:
         logger.warning(f"Mode file {file_path} missing 'mode:' section")
         return None
 
     mode_config = parsed["mode"]
-    tools_config = mode_config.get("tools", {})
+    tools_config = mode_config.get("tools") or {}
+    if not isinstance(tools_config, dict):
+        logger.warning(
+            "Mode file %s: tools must be a mapping, got %r; ignoring it.",
+            file_path,
+            tools_config,
+        )
+        tools_config = {}
 
     resolved_name = mode_config.get("name", file_path.stem)
+    if isinstance(resolved_name, str):
+        # Mode names end up as session_state and cache keys; interned copies
+        # let those dict lookups match by identity
+        resolved_name = sys.intern(resolved_name)
 
     if "shortcut" in mode_config:
         raw = mode_config["shortcut"]
@@ -162,16 +467,25 @@ def parse_mode_file(file_path: Path) -> ModeDefinition | None:
         description=mode_config.get("description", ""),
         shortcut=shortcut,
         context=markdown_body,
-        safe_tools=tools_config.get("safe", []),
-        warn_tools=tools_config.get("warn", []),
-        confirm_tools=tools_config.get("confirm", []),
-        block_tools=tools_config.get("block", []),
+        safe_tools=_tool_list(file_path, "safe", tools_config.get("safe")),
+        warn_tools=_tool_list(file_path, "warn", tools_config.get("warn")),
+        confirm_tools=_tool_list(file_path, "confirm", tools_config.get("confirm")),
+        block_tools=_tool_list(file_path, "block", tools_config.get("block")),
         default_action=mode_config.get("default_action", "block"),
         allowed_transitions=mode_config.get("allowed_transitions"),
         allow_clear=mode_config.get("allow_clear", True),
     )
 
 
+# Parsed mode files shared by every ModeDiscovery in the process (one per
+# session), keyed by real path (so symlinked or differently spelled paths share
+# one entry) and tagged with the (st_mtime_ns, st_size) signature they were
+# parsed at. The stored definitions are never handed out: each instance gets
+# its own shallow copy, since callers set `source` and ModeHooks caches
+# session-specific rendered context on the definition.
+_SHARED_FILE_CACHE: dict[str, tuple[int, int, ModeDefinition | None]] = {}
+
+
 class ModeDiscovery:
     """Discover mode definitions from search paths.
 
@@ -204,7 +518,12 @@ class ModeDiscovery:
             self._search_paths = normalized
         else:
             self._search_paths = self._default_search_paths()
+        # Membership index over _search_paths for O(1) dedup in add_search_path
+        self._search_path_set: set[Path] = {p for p, _s in self._search_paths}
         self._cache: dict[str, ModeDefinition] = {}
+        # Parsed files keyed by path, tagged with the (st_mtime_ns, st_size)
+        # signature they were parsed at
+        self._file_cache: dict[Path, tuple[int, int, ModeDefinition | None]] = {}
         self._coordinator = coordinator
         self._bundle_discovery_done = False
         self._deferred_paths = deferred_paths or []
@@ -227,7 +546,13 @@ class ModeDiscovery:
 
     def add_search_path(self, path: Path, source: str = "") -> None:
         """Add a search path (e.g., from bundle)."""
-        if path.exists() and path not in [p for p, _s in self._search_paths]:
+        if path.exists():
+            self._add_existing_search_path(path, source)
+
+    def _add_existing_search_path(self, path: Path, source: str) -> None:
+        """Add a search path the caller has already confirmed is a directory."""
+        if path not in self._search_path_set:
+            self._search_path_set.add(path)
             self._search_paths.append((path, source))
 
     def _ensure_bundle_discovery(self) -> None:
@@ -275,32 +600,44 @@ class ModeDiscovery:
             list(bundles.keys()),
         )
         for namespace, bundle in bundles.items():
-            # Collect all candidate base paths for this bundle
-            candidate_paths: list[Path] = []
+            # Collect all candidate base paths for this bundle as strings;
+            # Path objects are only built for the survivors of the dedup.
+            raw_paths: list[str] = []
 
             if hasattr(bundle, "base_path") and bundle.base_path:
-                candidate_paths.append(Path(bundle.base_path))
+                raw_paths.append(str(bundle.base_path))
 
             # Also check source_base_paths for multi-source bundles
-            for sbp in getattr(bundle, "source_base_paths", None) or []:
-                p = Path(sbp)
-                if p not in candidate_paths:
-                    candidate_paths.append(p)
+            raw_paths.extend(
+                str(sbp) for sbp in getattr(bundle, "source_base_paths", None) or []
+            )
+
+            # Ordered dedup in one pass
+            candidate_paths = [Path(p) for p in dict.fromkeys(raw_paths)]
 
             logger.debug(
                 "Bundle '%s': candidate paths = %s", namespace, candidate_paths
             )
             for base in candidate_paths:
                 bundle_modes = base / "modes"
-                if bundle_modes.exists() and bundle_modes.is_dir():
-                    mode_files = [f.stem for f in bundle_modes.glob("*.md")]
+                # is_dir() is False for missing paths too: one stat, not two
+                if bundle_modes.is_dir():
+                    # Only register the directory here. Its files are read
+                    # when a lookup needs them: find() stats one candidate
+                    # file per path and stops at the first hit, and only
+                    # scan_all() walks every directory.
                     logger.info(
-                        "Auto-discovered modes from bundle '%s': %s (files: %s)",
+                        "Auto-discovered modes from bundle '%s': %s",
                         namespace,
                         bundle_modes,
-                        mode_files,
                     )
-                    self.add_search_path(bundle_modes, source=namespace)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Bundle '%s' mode files: %s",
+                            namespace,
+                            [e.name[:-3] for e in _scan_mode_files(bundle_modes)],
+                        )
+                    self._add_existing_search_path(bundle_modes, namespace)
 
         # Resolve deferred @mention paths
         if self._deferred_paths:
@@ -346,11 +683,11 @@ class ModeDiscovery:
                     continue
 
                 resolved = Path(base) / subpath if subpath else Path(base)
-                if resolved.exists() and resolved.is_dir():
+                if resolved.is_dir():
                     logger.info(
                         "Resolved deferred path '%s' -> %s", mention_path, resolved
                     )
-                    self.add_search_path(resolved, source=namespace)
+                    self._add_existing_search_path(resolved, namespace)
                 else:
                     logger.warning(
                         "Resolved deferred path '%s' -> %s (does not exist)",
@@ -364,6 +701,68 @@ class ModeDiscovery:
             self._search_paths,
         )
 
+    def _parse_cached(self, mode_file: Path) -> ModeDefinition | None:
+        """Parse a mode file, reusing the cached result while mtime and size match.
+
+        Returns None without logging when the file does not exist, so callers
+        can probe candidate paths with a single stat.
+        """
+        return self._parse_many([mode_file])[0]
+
+    def _parse_many(
+        self, mode_files: Sequence[Path | os.DirEntry[str]]
+    ) -> list[ModeDefinition | None]:
+        """Batch form of _parse_cached; results line up with `mode_files`.
+
+        Accepts scandir entries as well as paths so the signature check can use
+        ``DirEntry.stat()`` (cached on the entry, free on Windows). Files another
+        instance has already parsed are copied from _SHARED_FILE_CACHE instead
+        of being parsed again.
+        """
+        results: list[ModeDefinition | None] = [None] * len(mode_files)
+
+        for i, item in enumerate(mode_files):
+            mode_file = item if isinstance(item, Path) else Path(item.path)
+            try:
+                st = item.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                # Missing, or its search path is a regular file: silent miss
+                self._file_cache.pop(mode_file, None)
+                continue
+            except OSError:
+                results[i] = parse_mode_file(mode_file)  # logs the error
+                continue
+            cached = self._file_cache.get(mode_file)
+            if (
+                cached is not None
+                and cached[0] == st.st_mtime_ns
+                and cached[1] == st.st_size
+            ):
+                results[i] = cached[2]
+                continue
+            # Resolved only on an instance-cache miss; realpath costs a stat
+            # per path component
+            shared_key = os.path.realpath(mode_file)
+            shared = _SHARED_FILE_CACHE.get(shared_key)
+            if (
+                shared is not None
+                and shared[0] == st.st_mtime_ns
+                and shared[1] == st.st_size
+            ):
+                mode_def = copy.copy(shared[2])
+                results[i] = mode_def
+                self._file_cache[mode_file] = (st.st_mtime_ns, st.st_size, mode_def)
+            else:
+                mode_def = parse_mode_file(mode_file)
+                results[i] = mode_def
+                self._file_cache[mode_file] = (st.st_mtime_ns, st.st_size, mode_def)
+                _SHARED_FILE_CACHE[shared_key] = (
+                    st.st_mtime_ns,
+                    st.st_size,
+                    copy.copy(mode_def),
+                )
+        return results
+
     def find(self, name: str) -> ModeDefinition | None:
         """Find a mode definition by name."""
         self._ensure_bundle_discovery()
@@ -372,75 +771,121 @@ class ModeDiscovery:
         if name in self._cache:
             return self._cache[name]
 
-        # Search paths
+        # Search paths. Files already parsed by scan_all() come straight
+        # from the file cache after one stat; missing files cost one stat.
         for base_path, source_label in self._search_paths:
-            mode_file = base_path / f"{name}.md"
-            if mode_file.exists():
-                mode_def = parse_mode_file(mode_file)
-                if mode_def:
-                    mode_def.source = source_label
-                    self._cache[name] = mode_def
-                    return mode_def
+            mode_def = self._parse_cached(base_path / f"{name}.md")
+            if mode_def:
+                mode_def.source = source_label
+                self._cache[sys.intern(name)] = mode_def
+                return mode_def
 
         return None
 
+    def scan_all(self) -> list[tuple[str, ModeDefinition]]:
+        """Walk every search path once and parse each mode file.
+
+        Returns ``(name, mode_def)`` pairs for every parseable file in
+        precedence order, where ``name`` is the file stem. The first pair for
+        a given name is the winner; later same-name pairs are shadowed but kept
+        so callers like get_shortcuts() can detect collisions. Winners are
+        written to the name cache so find() sees the highest-precedence mode.
+        """
+        self._ensure_bundle_discovery()
+        entries: list[tuple[str, ModeDefinition]] = []
+        winners: set[str] = set()
+
+        # Enumerate everything first, then parse as one batch
+        files = [
+            (sys.intern(entry.name[:-3]), entry, source_label)
+            for base_path, source_label in self._search_paths
+            for entry in _scan_mode_files(base_path)
+        ]
+        parsed = self._parse_many([entry for _n, entry, _s in files])
+
+        for (name, _entry, source_label), mode_def in zip(files, parsed):
+            if not mode_def:
+                continue
+            mode_def.source = source_label
+            entries.append((name, mode_def))
+            if name not in winners:  # First match wins (precedence)
+                winners.add(name)
+                self._cache[name] = mode_def
+
+        return entries
+
     def list_modes(self) -> list[tuple[str, str, str]]:
         """List all available modes as (name, description, source) tuples."""
-        self._ensure_bundle_discovery()
-        modes: dict[str, tuple[str, str]] = {}
+        modes: dict[str, ModeDefinition] = {}
+        for name, mode_def in self.scan_all():
+            modes.setdefault(name, mode_def)
 
-        for base_path, source_label in self._search_paths:
-            if not base_path.exists():
-                continue
-            for mode_file in base_path.glob("*.md"):
-                name = mode_file.stem
-                if name not in modes:  # First match wins (precedence)
-                    mode_def = parse_mode_file(mode_file)
-                    if mode_def:
-                        mode_def.source = source_label
-                        modes[name] = (mode_def.description, source_label)
-                        self._cache[name] = mode_def
+        return sorted(
+            (name, mode_def.description, mode_def.source)
+            for name, mode_def in modes.items()
+        )
 
-        return sorted((name, desc, source) for name, (desc, source) in modes.items())
+    def list_mode_names(self) -> list[str]:
+        """List the names of all mode files on the search paths, sorted.
+
+        Reads directory listings only; no file is opened or parsed. Meant for
+        hints such as "available modes" in error messages, where list_modes()
+        would parse every file. Names are file stems, so a file that would
+        fail to parse is still listed.
+        """
+        self._ensure_bundle_discovery()
+        return sorted(
+            {
+                entry.name[:-3]
+                for base_path, _source in self._search_paths
+                for entry in _scan_mode_files(base_path)
+            }
+        )
 
     def get_shortcuts(self) -> dict[str, str]:
         """Get mapping of shortcut -> mode name for all modes with shortcuts."""
-        self._ensure_bundle_discovery()
         shortcuts: dict[str, str] = {}
 
-        for base_path, _source_label in self._search_paths:
-            if not base_path.exists():
+        # Shadowed files are included so collision detection can compare
+        # mode_def.name values across search paths (same-stem files in different
+        # bundles may have different YAML name: fields).
+        for _name, mode_def in self.scan_all():
+            if not mode_def.shortcut:
                 continue
-            for mode_file in base_path.glob("*.md"):
-                name = mode_file.stem
-                # Always freshly parse each file so collision detection can compare
-                # mode_def.name values across search paths (same-stem files in different
-                # bundles may have different YAML name: fields).  Cache is updated with
-                # first-wins semantics so find() callers see the highest-precedence mode_def.
-                mode_def = parse_mode_file(mode_file)
-                if mode_def:
-                    if name not in self._cache:  # preserve first-wins cache precedence
-                        self._cache[name] = mode_def
-                    if mode_def.shortcut:
-                        if mode_def.shortcut in shortcuts:
-                            existing_name = shortcuts[mode_def.shortcut]
-                            if existing_name != mode_def.name:
-                                logger.info(
-                                    "Shortcut collision: /%s claimed by mode %r (precedence) "
-                                    "and again by mode %r (skipped). Set `shortcut:` explicitly "
-                                    "on one of them to disambiguate, or `shortcut: false` to disable.",
-                                    mode_def.shortcut,
-                                    existing_name,
-                                    mode_def.name,
-                                )
-                        else:
-                            shortcuts[mode_def.shortcut] = mode_def.name
+            if mode_def.shortcut in shortcuts:
+                existing_name = shortcuts[mode_def.shortcut]
+                if existing_name != mode_def.name:
+                    logger.info(
+                        "Shortcut collision: /%s claimed by mode %r (precedence) "
+                        "and again by mode %r (skipped). Set `shortcut:` explicitly "
+                        "on one of them to disambiguate, or `shortcut: false` to disable.",
+                        mode_def.shortcut,
+                        existing_name,
+                        mode_def.name,
+                    )
+            else:
+                shortcuts[mode_def.shortcut] = mode_def.name
 
         return shortcuts
 
     def clear_cache(self) -> None:
-        """Clear the mode definition cache."""
+        """Clear the mode definition cache.
+
+        Also evicts this instance's files from _SHARED_FILE_CACHE: both the
+        files it has parsed and anything directly inside its search paths. The
+        next lookup then re-reads them, even after an edit that kept the same
+        mtime and size.
+        """
+        search_dirs = {os.path.realpath(p) for p, _source in self._search_paths}
+        seen = {os.path.realpath(p) for p in self._file_cache}
+        for key in [
+            k
+            for k in _SHARED_FILE_CACHE
+            if k in seen or os.path.dirname(k) in search_dirs
+        ]:
+            del _SHARED_FILE_CACHE[key]
         self._cache.clear()
+        self._file_cache.clear()
 
 
 class ModeHooks:
@@ -460,6 +905,8 @@ class ModeHooks:
             if infrastructure_tools is not None
             else {"mode", "todo"}
         )
+        # (mode name, definition) resolved by the last _get_active_mode call
+        self._active_cache: tuple[str | None, ModeDefinition | None] = (None, None)
 
     def _get_active_mode(self) -> ModeDefinition | None:
         """Get the currently active mode definition.
@@ -467,25 +914,44 @@ class ModeHooks:
         Updates session_state["require_approval_tools"] for approval hook integration.
         This uses the generic key that approval hook respects, allowing modes to
         drive approval policy without the approval hook knowing about modes.
+
+        The resolved mode is memoized until active_mode changes (or discovery
+        drops the cached definition), so repeat calls skip the lookup and the
+        session_state write.
         """
         mode_name = self.coordinator.session_state.get("active_mode")
+        cached_name, cached_mode = self._active_cache
+        if (
+            mode_name
+            and mode_name == cached_name
+            and self.discovery._cache.get(mode_name) is cached_mode
+        ):
+            return cached_mode
+
         if not mode_name:
             # Clear approval requirements when no mode is active
-            self.coordinator.session_state["require_approval_tools"] = set()
+            self._active_cache = (None, None)
+            self.coordinator.session_state["require_approval_tools"] = (
+                _NO_APPROVAL_TOOLS
+            )
             return None
 
         mode = self.discovery.find(mode_name)
         if mode:
             # Populate generic approval key - approval hook checks this
-            self.coordinator.session_state["require_approval_tools"] = set(
-                mode.confirm_tools
-            )
+            self._active_cache = (mode_name, mode)
+            self.coordinator.session_state["require_approval_tools"] = mode._confirm_set
         else:
-            self.coordinator.session_state["require_approval_tools"] = set()
+            self._active_cache = (None, None)
+            self.coordinator.session_state["require_approval_tools"] = (
+                _NO_APPROVAL_TOOLS
+            )
 
         return mode
 
-    def _resolve_mentions(self, content: str) -> str:
+    def _resolve_mentions(
+        self, content: str
+    ) -> tuple[str, list[tuple[Path, int, int]] | None]:
         """Resolve @namespace:path mentions in mode context content.
 
         Lines that consist solely of an @-mention (e.g. ``@superpowers:context/foo.md``)
@@ -496,15 +962,24 @@ class ModeHooks:
         The method is a no-op when:
         - the content contains no ``@`` character (fast path), or
         - no ``mention_resolver`` capability is registered on the coordinator.
+
+        Returns ``(content, sources)``. ``sources`` holds the
+        ``(path, st_mtime_ns, st_size)`` of every file read, or is None when a
+        mention line was dropped or there was no resolver to try, so the
+        caller knows a later attempt might produce something different.
         """
         if "@" not in content:
-            return content
+            return content, []
 
         resolver = self.coordinator.get_capability("mention_resolver")
         if not resolver:
-            return content
+            return content, None
+
+        dropped = False
+        sources: list[tuple[Path, int, int]] = []
 
         def _replace(match: re.Match[str]) -> str:
+            nonlocal dropped
             mention = match.group(1)
             try:
                 resolved_path = resolver.resolve(mention)
@@ -513,8 +988,12 @@ class ModeHooks:
                         "mode @-mention resolution: could not resolve '%s' — line removed",
                         mention,
                     )
+                    dropped = True
                     return ""
-                file_content = Path(resolved_path).read_text(encoding="utf-8")
+                path = Path(resolved_path)
+                st = path.stat()
+                file_content = path.read_text(encoding="utf-8")
+                sources.append((path, st.st_mtime_ns, st.st_size))
                 return file_content
             except Exception as exc:
                 logger.warning(
@@ -522,31 +1001,43 @@ class ModeHooks:
                     mention,
                     exc,
                 )
+                dropped = True
                 return ""
 
-        return re.sub(r"^\s*(@\S+:\S+)\s*$", _replace, content, flags=re.MULTILINE)
+        resolved = re.sub(r"^\s*(@\S+:\S+)\s*$", _replace, content, flags=re.MULTILINE)
+        return resolved, None if dropped else sources
 
-    async def handle_provider_request(self, _event: str, _data: dict) -> "HookResult":
+    async def handle_provider_request(self, _event: str, _data: dict) -> HookResult:
         """Inject mode context on every provider request."""
-        from amplifier_core.models import HookResult
-
         mode = self._get_active_mode()
         if not mode or not mode.context:
             return HookResult(action="continue")
 
-        # Resolve any @namespace:path mentions in the mode body before injection
-        resolved_context = self._resolve_mentions(mode.context)
-
-        # Wrap context in system-reminder tags with explicit MODE ACTIVE banner
-        context_block = (
-            f'<system-reminder source="mode-{mode.name}">\n'
-            f"MODE ACTIVE: {mode.name}\n"
-            f"You are CURRENTLY in {mode.name} mode. It is already active — "
-            f'do NOT call mode(set, "{mode.name}") to re-activate it. '
-            f"Follow the guidance below.\n\n"
-            f"{resolved_context}\n"
-            f"</system-reminder>"
-        )
+        # The block is deterministic per mode definition and @-mentioned file
+        # contents, so it is rendered once and reused while those files are
+        # unchanged (one stat each). It is only cached when every @-mention
+        # resolved; while the mention_resolver capability is missing or a
+        # mention fails, render fresh each time so the lost context can come back.
+        context_block = mode._rendered_context
+        if context_block is not None and not _sources_unchanged(mode._rendered_sources):
+            context_block = None
+        if context_block is None:
+            # Resolve any @namespace:path mentions in the mode body before injection
+            resolved_context, sources = self._resolve_mentions(mode.context)
+
+            # Wrap context in system-reminder tags with explicit MODE ACTIVE banner
+            context_block = (
+                f'<system-reminder source="mode-{mode.name}">\n'
+                f"MODE ACTIVE: {mode.name}\n"
+                f"You are CURRENTLY in {mode.name} mode. It is already active — "
+                f'do NOT call mode(set, "{mode.name}") to re-activate it. '
+                f"Follow the guidance below.\n\n"
+                f"{resolved_context}\n"
+                f"</system-reminder>"
+            )
+            if sources is not None:
+                mode._rendered_context = context_block
+                mode._rendered_sources = tuple(sources)
 
         return HookResult(
             action="inject_context",
@@ -555,10 +1046,8 @@ class ModeHooks:
             ephemeral=True,
         )
 
-    async def handle_tool_pre(self, _event: str, data: dict) -> "HookResult":
+    async def handle_tool_pre(self, _event: str, data: dict) -> HookResult:
         """Moderate tools based on active mode policy."""
-        from amplifier_core.models import HookResult
-
         mode = self._get_active_mode()
         if not mode:
             return HookResult(action="continue")
@@ -569,33 +1058,31 @@ class ModeHooks:
         if tool_name in self.infrastructure_tools:
             return HookResult(action="continue")
 
-        # Safe tools: always allow
-        if tool_name in mode.safe_tools:
-            return HookResult(action="continue")
-
-        # Explicitly blocked tools: always deny
-        if tool_name in mode.block_tools:
-            return HookResult(
-                action="deny",
-                reason=f"Mode '{mode.name}': '{tool_name}' is blocked. {mode.description}",
-            )
-
-        # Confirm tools: let approval hook handle it
-        # (mode_confirm_tools is already set in session state by _get_active_mode)
-        if tool_name in mode.confirm_tools:
-            return HookResult(action="continue")
-
-        # Warn-first tools: warn once, then allow
-        if tool_name in mode.warn_tools:
-            warn_key = f"{mode.name}:{tool_name}"
-            if warn_key not in self.warned_tools:
-                self.warned_tools.add(warn_key)
+        match mode._policy.get(tool_name):
+            case "safe":
+                # Safe tools: always allow
+                return HookResult(action="continue")
+            case "block":
+                # Explicitly blocked tools: always deny
                 return HookResult(
                     action="deny",
-                    reason=f"Mode '{mode.name}': '{tool_name}' requires confirmation. "
-                    f"Call again if this is appropriate for {mode.name} mode.",
+                    reason=f"Mode '{mode.name}': '{tool_name}' is blocked. {mode.description}",
                 )
-            return HookResult(action="continue")
+            case "confirm":
+                # Confirm tools: let approval hook handle it
+                # (require_approval_tools is already set in session state by _get_active_mode)
+                return HookResult(action="continue")
+            case "warn":
+                # Warn-first tools: warn once, then allow
+                warn_key = mode._warn_prefix + tool_name
+                if warn_key not in self.warned_tools:
+                    self.warned_tools.add(warn_key)
+                    return HookResult(
+                        action="deny",
+                        reason=f"Mode '{mode.name}': '{tool_name}' requires confirmation. "
+                        f"Call again if this is appropriate for {mode.name} mode.",
+                    )
+                return HookResult(action="continue")
 
         # Default action for unlisted tools
         if mode.default_action == "allow":
@@ -676,9 +1163,9 @@ async def mount(
     bundle_root = modules_dir.parent  # bundle root
     bundle_modes_dir = bundle_root / "modes"
 
-    if bundle_modes_dir.exists() and bundle_modes_dir.is_dir():
+    if bundle_modes_dir.is_dir():
         logger.info(f"Auto-discovered bundle modes directory: {bundle_modes_dir}")
-        discovery.add_search_path(bundle_modes_dir, source="modes")
+        discovery._add_existing_search_path(bundle_modes_dir, "modes")
     else:
         logger.warning(f"Bundle modes directory not found at {bundle_modes_dir}")
 
@@ -0,0 +1,81 @@
+"""Helpers shared by the hooks-mode test modules."""
+
+from __future__ import annotations
+
+import textwrap
+from collections.abc import Sequence
+from pathlib import Path
+
+# Dedented once at import; create_mode_file only fills in the fields
+_MODE_TEMPLATE = textwrap.dedent("""\
+    ---
+    mode:
+      name: {name}
+      description: "{description}"
+      tools:
+        safe: [{safe}]
+      default_action: block
+    ---
+    # {title} Mode
+    You are in {name} mode.
+""")
+
+
+def create_mode_file(
+    path: Path,
+    name: str,
+    description: str = "",
+    safe_tools: Sequence[str] = ("read_file", "grep"),
+) -> Path:
+    """Create a minimal mode .md file with valid YAML frontmatter."""
+    mode_file = path / f"{name}.md"
+    mode_file.write_text(
+        _MODE_TEMPLATE.format(
+            name=name,
+            description=description or f"{name} mode",
+            safe=", ".join(safe_tools),
+            title=name.title(),
+        ),
+        encoding="utf-8",
+    )
+    return mode_file
+
+
+class StubBundle:
+    """Minimal bundle: just the path attributes discovery reads."""
+
+    __slots__ = ("base_path", "source_base_paths")
+
+    def __init__(
+        self, base_path: str | None = None, source_base_paths: list[str] | None = None
+    ) -> None:
+        self.base_path = base_path
+        self.source_base_paths = source_base_paths
+
+
+class StubResolver:
+    """Minimal mention_resolver exposing `bundles` or `foundation_resolver`."""
+
+    __slots__ = ("bundles", "foundation_resolver")
+
+    def __init__(
+        self,
+        bundles: dict[str, StubBundle] | None = None,
+        foundation_resolver: StubResolver | None = None,
+    ) -> None:
+        self.bundles = bundles
+        self.foundation_resolver = foundation_resolver
+
+
+class StubCoordinator:
+    """Coordinator serving fixed capabilities and counting lookups."""
+
+    __slots__ = ("_capabilities", "capability_calls")
+
+    def __init__(self, **capabilities: object) -> None:
+        self._capabilities = capabilities
+        self.capability_calls = 0
+
+    def get_capability(self, name: str) -> object:
+        self.capability_calls += 1
+        return self._capabilities.get(name)
@@ -2,40 +2,26 @@
 
 from __future__ import annotations
 
+import logging
+import os
 import textwrap
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+import yaml
 
+import amplifier_module_hooks_mode as hooks_mode
 from amplifier_module_hooks_mode import ModeDefinition, ModeDiscovery, parse_mode_file
 
-
-def _create_mode_file(path: Path, name: str, description: str = "") -> Path:
-    """Helper: create a minimal mode .md file with valid YAML frontmatter."""
-    mode_file = path / f"{name}.md"
-    mode_file.write_text(
-        textwrap.dedent(f"""\
-            ---
-            mode:
-              name: {name}
-              description: "{description or name + " mode"}"
-              tools:
-                safe: [read_file, grep]
-              default_action: block
-            ---
-            # {name.title()} Mode
-            You are in {name} mode.
-        """),
-        encoding="utf-8",
-    )
-    return mode_file
+from .helpers import StubBundle, StubCoordinator, StubResolver, create_mode_file
 
 
 class TestParseMode:
     """Tests for parse_mode_file."""
 
     def test_valid_mode_file(self, tmp_path: Path) -> None:
-        mode_file = _create_mode_file(tmp_path, "plan", "Think and discuss")
+        mode_file = create_mode_file(tmp_path, "plan", "Think and discuss")
         result = parse_mode_file(mode_file)
         assert result is not None
         assert result.name == "plan"
@@ -49,6 +35,25 @@ class TestParseMode:
         mode_file.write_text("# No frontmatter\nJust content.")
         assert parse_mode_file(mode_file) is None
 
+    def test_crlf_line_endings(self, tmp_path: Path) -> None:
+        mode_file = tmp_path / "crlf.md"
+        mode_file.write_bytes(
+            b"---\r\nmode:\r\n  name: crlf\r\n  default_action: allow\r\n---\r\nBody\r\n"
+        )
+        result = parse_mode_file(mode_file)
+        assert result is not None
+        assert result.name == "crlf"
+        assert result.default_action == "allow"
+        assert result.context == "Body"
+
+    def test_non_ascii_frontmatter_and_body(self, tmp_path: Path) -> None:
+        mode_file = create_mode_file(tmp_path, "café", "Réfléchir — planifier")
+        result = parse_mode_file(mode_file)
+        assert result is not None
+        assert result.name == "café"
+        assert result.description == "Réfléchir — planifier"
+        assert "You are in café mode." in result.context
+
     def test_missing_mode_section(self, tmp_path: Path) -> None:
         mode_file = tmp_path / "bad.md"
         mode_file.write_text("---\nother: stuff\n---\nContent")
@@ -57,6 +62,10 @@ class TestParseMode:
     def test_nonexistent_file(self, tmp_path: Path) -> None:
         assert parse_mode_file(tmp_path / "nonexistent.md") is None
 
+    def test_directory_path_returns_none(self, tmp_path: Path) -> None:
+        (tmp_path / "dir.md").mkdir()
+        assert parse_mode_file(tmp_path / "dir.md") is None
+
     def test_parse_allowed_transitions(self, tmp_path: Path) -> None:
         """parse_mode_file must extract allowed_transitions from mode: section."""
         mode_file = tmp_path / "strict.md"
@@ -84,7 +93,7 @@ class TestParseMode:
         self, tmp_path: Path
     ) -> None:
         """When allowed_transitions is absent, parse_mode_file must return None (not [])."""
-        mode_file = _create_mode_file(tmp_path, "basic", "Basic mode")
+        mode_file = create_mode_file(tmp_path, "basic", "Basic mode")
         result = parse_mode_file(mode_file)
         assert result is not None
         assert result.allowed_transitions is None
@@ -112,7 +121,7 @@ class TestParseMode:
 
     def test_parse_allow_clear_absent_defaults_to_true(self, tmp_path: Path) -> None:
         """When allow_clear is absent, parse_mode_file must default to True."""
-        mode_file = _create_mode_file(tmp_path, "basic2", "Basic mode")
+        mode_file = create_mode_file(tmp_path, "basic2", "Basic mode")
         result = parse_mode_file(mode_file)
         assert result is not None
         assert result.allow_clear is True
@@ -163,12 +172,80 @@ class TestParseMode:
 
     def test_missing_new_fields_uses_defaults(self, tmp_path: Path) -> None:
         """Backward compat: absent fields = permissive defaults."""
-        mode_file = _create_mode_file(tmp_path, "legacy", "Legacy mode")
+        mode_file = create_mode_file(tmp_path, "legacy", "Legacy mode")
         result = parse_mode_file(mode_file)
         assert result is not None
         assert result.allowed_transitions is None  # None = any transition OK
         assert result.allow_clear is True  # True = clear is allowed
 
+    def test_malformed_tool_lists_are_normalized(self, tmp_path: Path, caplog) -> None:
+        mode_file = tmp_path / "odd.md"
+        mode_file.write_text(
+            textwrap.dedent("""\
+                ---
+                mode:
+                  name: odd
+                  tools:
+                    safe: 5
+                    warn: [bash, [nested], 7]
+                    confirm: {write_file: true}
+                ---
+                Body
+            """)
+        )
+        with caplog.at_level(logging.WARNING, logger="amplifier_module_hooks_mode"):
+            result = parse_mode_file(mode_file)
+        assert result is not None
+        assert result.safe_tools == []
+        assert result.warn_tools == ["bash"]
+        assert result.confirm_tools == []
+        assert result.block_tools == []
+        assert len(caplog.records) == 3
+
+    def test_non_mapping_tools_ignored(self, tmp_path: Path) -> None:
+        mode_file = tmp_path / "odd.md"
+        mode_file.write_text("---\nmode:\n  name: odd\n  tools: 5\n---\nBody\n")
+        result = parse_mode_file(mode_file)
+        assert result is not None
+        assert result.safe_tools == []
+
+
+class TestSimpleFrontmatter:
+    """The line-based frontmatter fast path must agree with the YAML loader."""
+
+    @pytest.mark.parametrize(
+        "frontmatter",
+        [
+            "mode:\n  name: plan\n  description: Plan, don't build\n",
+            'mode:\n  name: plan\n  description: "Think and discuss"\n',
+            "mode:\n  tools:\n    safe:\n      - read_file\n      - grep\n",
+            "mode:\n  tools:\n    safe:\n    - read_file\n    warn: [bash, 'x']\n",
+            "mode:\n  allowed_transitions: []\n\n  # comment\n  name: a\n",
+            "mode:\r\n  name: crlf\r\n",
+        ],
+    )
+    def test_simple_subset_matches_yaml(self, frontmatter: str) -> None:
+        data = frontmatter.encode()
+        result = hooks_mode._load_simple_frontmatter(data)
+        assert result is not None
+        assert result == yaml.safe_load(data)
+
+    @pytest.mark.parametrize(
+        "frontmatter",
+        [
+            "mode:\n  allow_clear: false\n",
+            "mode:\n  name: plan  # trailing comment\n",
+            "mode:\n  description: first\n    continued\n",
+            'mode:\n  description: "esc\\"aped"\n',
+            "mode:\n  tools:\n",
+            "mode:\n  name: &anchor plan\n",
+            "mode:\n\tname: plan\n",
+            "on:\n  name: plan\n",
+        ],
+    )
+    def test_outside_subset_falls_back(self, frontmatter: str) -> None:
+        assert hooks_mode._load_simple_frontmatter(frontmatter.encode()) is None
+
 
 class TestModeDiscovery:
     """Tests for ModeDiscovery search path behavior."""
@@ -176,7 +253,7 @@ class TestModeDiscovery:
     def test_find_from_explicit_search_path(self, tmp_path: Path) -> None:
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
-        _create_mode_file(modes_dir, "plan", "Plan mode")
+        create_mode_file(modes_dir, "plan", "Plan mode")
 
         discovery = ModeDiscovery(search_paths=[modes_dir])
         result = discovery.find("plan")
@@ -189,11 +266,30 @@ class TestModeDiscovery:
         discovery = ModeDiscovery(search_paths=[modes_dir])
         assert discovery.find("nonexistent") is None
 
+    def test_find_unknown_does_not_warn(self, tmp_path: Path, caplog) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        discovery = ModeDiscovery(search_paths=[modes_dir])
+        with caplog.at_level("WARNING", logger="amplifier_module_hooks_mode"):
+            assert discovery.find("nonexistent") is None
+        assert caplog.records == []
+
+    def test_find_with_file_search_path_does_not_warn(
+        self, tmp_path: Path, caplog
+    ) -> None:
+        not_a_dir = tmp_path / "modes"
+        not_a_dir.write_text("not a directory", encoding="utf-8")
+        discovery = ModeDiscovery(search_paths=[])
+        discovery.add_search_path(not_a_dir)
+        with caplog.at_level("WARNING", logger="amplifier_module_hooks_mode"):
+            assert discovery.find("plan") is None
+        assert caplog.records == []
+
     def test_list_modes(self, tmp_path: Path) -> None:
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
-        _create_mode_file(modes_dir, "plan", "Plan mode")
-        _create_mode_file(modes_dir, "review", "Review mode")
+        create_mode_file(modes_dir, "plan", "Plan mode")
+        create_mode_file(modes_dir, "review", "Review mode")
 
         discovery = ModeDiscovery(search_paths=[modes_dir])
         modes = discovery.list_modes()
@@ -201,25 +297,96 @@ class TestModeDiscovery:
         assert "plan" in names
         assert "review" in names
 
+    def test_list_modes_survives_malformed_tools(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        create_mode_file(modes_dir, "good", "Good mode")
+        (modes_dir / "bad.md").write_text(
+            "---\nmode:\n  name: bad\n  tools:\n    safe: 5\n---\nBody\n"
+        )
+
+        discovery = ModeDiscovery(search_paths=[modes_dir])
+        names = {name for name, _desc, _source in discovery.list_modes()}
+        assert names == {"bad", "good"}
+
+    def test_list_mode_names_does_not_parse(self, tmp_path: Path, monkeypatch) -> None:
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        create_mode_file(dir_a, "plan", "From A")
+        create_mode_file(dir_b, "plan", "From B")
+        create_mode_file(dir_b, "review", "Review mode")
+        (dir_b / "notes.txt").write_text("not a mode")
+
+        def _fail_parse(_path: Path) -> None:
+            raise AssertionError("list_mode_names() must not parse files")
+
+        monkeypatch.setattr(hooks_mode, "parse_mode_file", _fail_parse)
+        discovery = ModeDiscovery(search_paths=[dir_a, dir_b])
+        assert discovery.list_mode_names() == ["plan", "review"]
+
     def test_first_path_wins_precedence(self, tmp_path: Path) -> None:
         dir_a = tmp_path / "a"
         dir_b = tmp_path / "b"
         dir_a.mkdir()
         dir_b.mkdir()
-        _create_mode_file(dir_a, "plan", "From A")
-        _create_mode_file(dir_b, "plan", "From B")
+        create_mode_file(dir_a, "plan", "From A")
+        create_mode_file(dir_b, "plan", "From B")
 
         discovery = ModeDiscovery(search_paths=[dir_a, dir_b])
         result = discovery.find("plan")
         assert result is not None
         assert result.description == "From A"
 
+    def test_scan_all_keeps_shadowed_entries_after_winner(self, tmp_path: Path) -> None:
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        create_mode_file(dir_a, "plan", "From A")
+        create_mode_file(dir_b, "plan", "From B")
+
+        discovery = ModeDiscovery(search_paths=[(dir_a, "a"), (dir_b, "b")])
+        entries = discovery.scan_all()
+        assert [(n, m.source) for n, m in entries] == [("plan", "a"), ("plan", "b")]
+        assert discovery.find("plan") is entries[0][1]
+
+    def test_batch_parse_preserves_precedence(self, tmp_path: Path) -> None:
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        names = [f"mode{i}" for i in range(6)]
+        for name in names:
+            create_mode_file(dir_a, name, "From A")
+            create_mode_file(dir_b, name, "From B")
+
+        discovery = ModeDiscovery(search_paths=[(dir_a, "a"), (dir_b, "b")])
+        assert discovery.list_modes() == [(n, "From A", "a") for n in names]
+
+    def test_many_search_paths_preserve_precedence(self, tmp_path: Path) -> None:
+        labels = ["a", "b", "c", "d"]
+        for label in labels:
+            (tmp_path / label).mkdir()
+            create_mode_file(tmp_path / label, "shared", f"From {label}")
+            create_mode_file(tmp_path / label, f"only-{label}", f"From {label}")
+
+        discovery = ModeDiscovery(
+            search_paths=[(tmp_path / label, label) for label in labels]
+        )
+        modes = discovery.list_modes()
+        assert ("shared", "From a", "a") in modes
+        assert [m for m in modes if m[0].startswith("only-")] == [
+            (f"only-{label}", f"From {label}", label) for label in labels
+        ]
+
     def test_add_search_path(self, tmp_path: Path) -> None:
         dir_a = tmp_path / "a"
         dir_b = tmp_path / "b"
         dir_a.mkdir()
         dir_b.mkdir()
-        _create_mode_file(dir_b, "extra", "Extra mode")
+        create_mode_file(dir_b, "extra", "Extra mode")
 
         discovery = ModeDiscovery(search_paths=[dir_a])
         assert discovery.find("extra") is None
@@ -232,7 +399,7 @@ class TestModeDiscovery:
     def test_cache_behavior(self, tmp_path: Path) -> None:
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
-        _create_mode_file(modes_dir, "plan", "Plan mode")
+        create_mode_file(modes_dir, "plan", "Plan mode")
 
         discovery = ModeDiscovery(search_paths=[modes_dir])
         # First call parses file
@@ -247,32 +414,120 @@ class TestModeDiscovery:
         assert result3 is not None
         assert result3.name == "plan"
 
+    def test_unchanged_file_parsed_once(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        create_mode_file(modes_dir, "plan", "Plan mode")
 
-class TestBundleDiscovery:
-    """Tests for _ensure_bundle_discovery (lazy bundle scanning)."""
+        discovery = ModeDiscovery(search_paths=[modes_dir])
+        discovery.list_modes()
+        first = discovery.find("plan")
+        discovery._cache.clear()  # drop the name cache, keep parsed files
+        discovery.get_shortcuts()
+        assert discovery.find("plan") is first
+
+    def test_parsed_files_shared_across_instances(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        create_mode_file(modes_dir, "plan", "Plan mode")
+
+        first = ModeDiscovery(search_paths=[(modes_dir, "one")]).find("plan")
+
+        def _fail_parse(_path: Path) -> None:
+            raise AssertionError("file should come from the shared cache")
+
+        monkeypatch.setattr(hooks_mode, "parse_mode_file", _fail_parse)
+        second = ModeDiscovery(search_paths=[(modes_dir, "two")]).find("plan")
+        assert second is not None and first is not None
+        assert second is not first
+        assert second.description == "Plan mode"
+        assert (first.source, second.source) == ("one", "two")
+
+    def test_modified_file_reparsed(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        mode_file = create_mode_file(modes_dir, "plan", "Before")
+
+        discovery = ModeDiscovery(search_paths=[modes_dir])
+        assert discovery.list_modes() == [("plan", "Before", "")]
+
+        create_mode_file(modes_dir, "plan", "After")
+        st = mode_file.stat()
+        os.utime(mode_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert discovery.list_modes() == [("plan", "After", "")]
+
+    def test_same_mtime_different_size_reparsed(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        mode_file = create_mode_file(modes_dir, "plan", "Before")
+        st = mode_file.stat()
 
-    def _make_coordinator_with_bundles(self, bundle_map: dict[str, Path]) -> MagicMock:
-        """Create a mock coordinator with bundles on the resolver."""
-        bundles = {}
-        for namespace, base_path in bundle_map.items():
-            bundle = MagicMock()
-            bundle.base_path = str(base_path)
-            bundles[namespace] = bundle
+        discovery = ModeDiscovery(search_paths=[modes_dir])
+        assert discovery.list_modes() == [("plan", "Before", "")]
 
-        resolver = MagicMock()
-        resolver.bundles = bundles
+        create_mode_file(modes_dir, "plan", "A longer description")
+        os.utime(mode_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert discovery.list_modes() == [("plan", "A longer description", "")]
 
-        coordinator = MagicMock()
-        coordinator.get_capability = MagicMock(
-            side_effect=lambda key: resolver if key == "mention_resolver" else None
+    def test_clear_cache_rereads_same_signature_edit(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        mode_file = create_mode_file(modes_dir, "plan", "Before")
+        st = mode_file.stat()
+
+        discovery = ModeDiscovery(search_paths=[modes_dir])
+        assert discovery.find("plan").description == "Before"
+
+        # Same size, mtime restored: invisible to the signature check
+        create_mode_file(modes_dir, "plan", "Edited")
+        os.utime(mode_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert ModeDiscovery(search_paths=[modes_dir]).find("plan").description == (
+            "Before"
         )
-        return coordinator
+
+        discovery.clear_cache()
+        assert discovery.find("plan").description == "Edited"
+        assert ModeDiscovery(search_paths=[modes_dir]).find("plan").description == (
+            "Edited"
+        )
+
+    def test_shared_cache_keyed_by_real_path(self, tmp_path: Path, monkeypatch) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        create_mode_file(modes_dir, "plan", "Plan mode")
+        link = tmp_path / "linked"
+        link.symlink_to(modes_dir, target_is_directory=True)
+
+        assert ModeDiscovery(search_paths=[modes_dir]).find("plan") is not None
+
+        def _fail_parse(_path: Path) -> None:
+            raise AssertionError("file should come from the shared cache")
+
+        monkeypatch.setattr(hooks_mode, "parse_mode_file", _fail_parse)
+        via_link = ModeDiscovery(search_paths=[link]).find("plan")
+        assert via_link is not None and via_link.description == "Plan mode"
+
+
+class TestBundleDiscovery:
+    """Tests for _ensure_bundle_discovery (lazy bundle scanning)."""
+
+    def _make_coordinator_with_bundles(
+        self, bundle_map: dict[str, Path]
+    ) -> StubCoordinator:
+        """Create a stub coordinator with bundles on the resolver."""
+        bundles = {
+            namespace: StubBundle(base_path=str(base_path))
+            for namespace, base_path in bundle_map.items()
+        }
+        return StubCoordinator(mention_resolver=StubResolver(bundles=bundles))
 
     def test_discovers_modes_from_composed_bundles(self, tmp_path: Path) -> None:
         bundle_a = tmp_path / "bundle-a"
         bundle_a_modes = bundle_a / "modes"
         bundle_a_modes.mkdir(parents=True)
-        _create_mode_file(bundle_a_modes, "brainstorm", "Brainstorm mode")
+        create_mode_file(bundle_a_modes, "brainstorm", "Brainstorm mode")
 
         coordinator = self._make_coordinator_with_bundles({"bundle-a": bundle_a})
         discovery = ModeDiscovery(search_paths=[], coordinator=coordinator)
@@ -286,8 +541,8 @@ class TestBundleDiscovery:
         bundle_b = tmp_path / "bundle-b"
         (bundle_a / "modes").mkdir(parents=True)
         (bundle_b / "modes").mkdir(parents=True)
-        _create_mode_file(bundle_a / "modes", "alpha", "Alpha mode")
-        _create_mode_file(bundle_b / "modes", "beta", "Beta mode")
+        create_mode_file(bundle_a / "modes", "alpha", "Alpha mode")
+        create_mode_file(bundle_b / "modes", "beta", "Beta mode")
 
         coordinator = self._make_coordinator_with_bundles(
             {
@@ -302,6 +557,34 @@ class TestBundleDiscovery:
         assert "alpha" in names
         assert "beta" in names
 
+    def test_find_does_not_walk_bundle_dirs(
+        self, tmp_path: Path, caplog, monkeypatch
+    ) -> None:
+        bundle_a = tmp_path / "bundle-a"
+        bundle_b = tmp_path / "bundle-b"
+        (bundle_a / "modes").mkdir(parents=True)
+        (bundle_b / "modes").mkdir(parents=True)
+        create_mode_file(bundle_a / "modes", "alpha", "Alpha mode")
+        create_mode_file(bundle_b / "modes", "beta", "Beta mode")
+
+        scanned: list[Path] = []
+        real_scan = hooks_mode._scan_mode_files
+
+        def _recording_scan(directory: Path):
+            scanned.append(directory)
+            return real_scan(directory)
+
+        monkeypatch.setattr(hooks_mode, "_scan_mode_files", _recording_scan)
+        coordinator = self._make_coordinator_with_bundles(
+            {"a": bundle_a, "b": bundle_b}
+        )
+        discovery = ModeDiscovery(search_paths=[], coordinator=coordinator)
+
+        with caplog.at_level(logging.INFO, logger="amplifier_module_hooks_mode"):
+            result = discovery.find("alpha")
+        assert result is not None
+        assert scanned == []
+
     def test_skips_bundles_without_modes_dir(self, tmp_path: Path) -> None:
         bundle_a = tmp_path / "bundle-a"
         bundle_a.mkdir()
@@ -317,8 +600,7 @@ class TestBundleDiscovery:
         assert discovery.list_modes() == []
 
     def test_no_mention_resolver_logs_warning(self, tmp_path: Path) -> None:
-        coordinator = MagicMock()
-        coordinator.get_capability = MagicMock(return_value=None)
+        coordinator = StubCoordinator()
 
         discovery = ModeDiscovery(search_paths=[], coordinator=coordinator)
         # Should not crash
@@ -328,23 +610,16 @@ class TestBundleDiscovery:
         """When resolver is AppMentionResolver, reach through .foundation_resolver."""
         bundle_a = tmp_path / "bundle-a"
         (bundle_a / "modes").mkdir(parents=True)
-        _create_mode_file(bundle_a / "modes", "deep", "Deep mode")
+        create_mode_file(bundle_a / "modes", "deep", "Deep mode")
 
-        inner_resolver = MagicMock()
-        inner_resolver.bundles = {
-            "a": MagicMock(base_path=str(bundle_a)),
-        }
+        inner_resolver = StubResolver(
+            bundles={"a": StubBundle(base_path=str(bundle_a))}
+        )
 
         # Outer resolver has no .bundles, but has .foundation_resolver
-        outer_resolver = MagicMock(spec=[])
-        outer_resolver.foundation_resolver = inner_resolver
+        outer_resolver = StubResolver(foundation_resolver=inner_resolver)
 
-        coordinator = MagicMock()
-        coordinator.get_capability = MagicMock(
-            side_effect=lambda key: (
-                outer_resolver if key == "mention_resolver" else None
-            )
-        )
+        coordinator = StubCoordinator(mention_resolver=outer_resolver)
 
         discovery = ModeDiscovery(search_paths=[], coordinator=coordinator)
         result = discovery.find("deep")
@@ -354,7 +629,7 @@ class TestBundleDiscovery:
     def test_discovery_runs_only_once(self, tmp_path: Path) -> None:
         bundle_a = tmp_path / "bundle-a"
         (bundle_a / "modes").mkdir(parents=True)
-        _create_mode_file(bundle_a / "modes", "once", "Once mode")
+        create_mode_file(bundle_a / "modes", "once", "Once mode")
 
         coordinator = self._make_coordinator_with_bundles({"a": bundle_a})
         discovery = ModeDiscovery(search_paths=[], coordinator=coordinator)
@@ -362,9 +637,9 @@ class TestBundleDiscovery:
         # First call triggers discovery
         discovery.find("once")
         # Second call should NOT re-query coordinator
-        coordinator.get_capability.reset_mock()
+        calls = coordinator.capability_calls
         discovery.find("once")
-        coordinator.get_capability.assert_not_called()
+        assert coordinator.capability_calls == calls
 
 
 class TestModeDefinitionNewFields:
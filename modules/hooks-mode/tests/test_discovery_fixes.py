@@ -2,33 +2,11 @@
 
 from __future__ import annotations
 
-import textwrap
 from pathlib import Path
-from unittest.mock import MagicMock
-
 
 from amplifier_module_hooks_mode import ModeDiscovery
 
-
-def _create_mode_file(path: Path, name: str, description: str = "") -> Path:
-    """Helper: create a minimal mode .md file with valid YAML frontmatter."""
-    mode_file = path / f"{name}.md"
-    mode_file.write_text(
-        textwrap.dedent(f"""\
-            ---
-            mode:
-              name: {name}
-              description: "{description or name + " mode"}"
-              tools:
-                safe: [read_file]
-              default_action: block
-            ---
-            # {name.title()} Mode
-            You are in {name} mode.
-        """),
-        encoding="utf-8",
-    )
-    return mode_file
+from .helpers import StubBundle, StubCoordinator, StubResolver, create_mode_file
 
 
 # ---------------------------------------------------------------------------
@@ -43,19 +21,12 @@ class TestSourceBasePaths:
         """Bundles with source_base_paths (no base_path) should be discovered."""
         bundle_dir = tmp_path / "multi-source-bundle"
         (bundle_dir / "modes").mkdir(parents=True)
-        _create_mode_file(bundle_dir / "modes", "sourced", "From source_base_paths")
+        create_mode_file(bundle_dir / "modes", "sourced", "From source_base_paths")
 
-        bundle = MagicMock()
-        bundle.base_path = None  # No direct base_path
-        bundle.source_base_paths = [str(bundle_dir)]
-
-        resolver = MagicMock()
-        resolver.bundles = {"multi": bundle}
-
-        coordinator = MagicMock()
-        coordinator.get_capability = MagicMock(
-            side_effect=lambda key: resolver if key == "mention_resolver" else None
-        )
+        # No direct base_path
+        bundle = StubBundle(source_base_paths=[str(bundle_dir)])
+        resolver = StubResolver(bundles={"multi": bundle})
+        coordinator = StubCoordinator(mention_resolver=resolver)
 
         discovery = ModeDiscovery(search_paths=[], coordinator=coordinator)
         result = discovery.find("sourced")
@@ -68,20 +39,12 @@ class TestSourceBasePaths:
         dir_b = tmp_path / "src-b"
         (dir_a / "modes").mkdir(parents=True)
         (dir_b / "modes").mkdir(parents=True)
-        _create_mode_file(dir_a / "modes", "from-a", "From A")
-        _create_mode_file(dir_b / "modes", "from-b", "From B")
-
-        bundle = MagicMock()
-        bundle.base_path = None
-        bundle.source_base_paths = [str(dir_a), str(dir_b)]
+        create_mode_file(dir_a / "modes", "from-a", "From A")
+        create_mode_file(dir_b / "modes", "from-b", "From B")
 
-        resolver = MagicMock()
-        resolver.bundles = {"multi": bundle}
-
-        coordinator = MagicMock()
-        coordinator.get_capability = MagicMock(
-            side_effect=lambda key: resolver if key == "mention_resolver" else None
-        )
+        bundle = StubBundle(source_base_paths=[str(dir_a), str(dir_b)])
+        resolver = StubResolver(bundles={"multi": bundle})
+        coordinator = StubCoordinator(mention_resolver=resolver)
 
         discovery = ModeDiscovery(search_paths=[], coordinator=coordinator)
         modes = discovery.list_modes()
@@ -103,19 +66,12 @@ class TestMentionPathResolution:
         bundle_dir = tmp_path / "superpowers"
         modes_dir = bundle_dir / "modes"
         modes_dir.mkdir(parents=True)
-        _create_mode_file(modes_dir, "brainstorm", "Brainstorm mode")
-
-        # Mock a bundle whose base_path resolves @superpowers -> bundle_dir
-        bundle = MagicMock()
-        bundle.base_path = str(bundle_dir)
-
-        resolver = MagicMock()
-        resolver.bundles = {"superpowers": bundle}
+        create_mode_file(modes_dir, "brainstorm", "Brainstorm mode")
 
-        coordinator = MagicMock()
-        coordinator.get_capability = MagicMock(
-            side_effect=lambda key: resolver if key == "mention_resolver" else None
-        )
+        # Stub a bundle whose base_path resolves @superpowers -> bundle_dir
+        bundle = StubBundle(base_path=str(bundle_dir))
+        resolver = StubResolver(bundles={"superpowers": bundle})
+        coordinator = StubCoordinator(mention_resolver=resolver)
 
         # Pass @mention path as a deferred_path — NOT a filesystem path
         discovery = ModeDiscovery(
@@ -130,13 +86,8 @@ class TestMentionPathResolution:
 
     def test_at_mention_invalid_namespace_logged(self, tmp_path: Path) -> None:
         """Unknown @namespace should not crash, just skip."""
-        resolver = MagicMock()
-        resolver.bundles = {}  # No bundles
-
-        coordinator = MagicMock()
-        coordinator.get_capability = MagicMock(
-            side_effect=lambda key: resolver if key == "mention_resolver" else None
-        )
+        resolver = StubResolver(bundles={})  # No bundles
+        coordinator = StubCoordinator(mention_resolver=resolver)
 
         discovery = ModeDiscovery(
             search_paths=[],
@@ -151,7 +102,7 @@ class TestMentionPathResolution:
         """Non-@ paths should still work as before."""
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
-        _create_mode_file(modes_dir, "plan", "Plan mode")
+        create_mode_file(modes_dir, "plan", "Plan mode")
 
         discovery = ModeDiscovery(search_paths=[modes_dir])
         result = discovery.find("plan")
@@ -171,7 +122,7 @@ class TestRelativePathResolution:
         project_dir = tmp_path / "my-project"
         project_modes = project_dir / "custom-modes"
         project_modes.mkdir(parents=True)
-        _create_mode_file(project_modes, "custom", "Custom mode")
+        create_mode_file(project_modes, "custom", "Custom mode")
 
         # Simulate mount() behavior: relative path with explicit working_dir
         working_dir = project_dir
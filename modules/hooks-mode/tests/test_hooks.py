@@ -8,7 +8,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from amplifier_module_hooks_mode import ModeDiscovery, ModeHooks
+from amplifier_module_hooks_mode import ModeDefinition, ModeDiscovery, ModeHooks
 
 
 def _create_mode_file(path: Path, name: str, description: str = "") -> Path:
@@ -263,3 +263,102 @@ class TestModeActiveSignal:
         content = result.context_injection
         assert content.startswith('<system-reminder source="mode-plan">')
         assert content.rstrip().endswith("</system-reminder>")
+
+
+class TestToolPolicySets:
+    """Tool policies are resolved once per ModeDefinition into a lookup table."""
+
+    def test_policy_table_mirrors_tool_lists(self) -> None:
+        mode = ModeDefinition(
+            name="m", safe_tools=["a"], warn_tools=["b"], confirm_tools=["c"]
+        )
+        assert mode._policy == {"a": "safe", "b": "warn", "c": "confirm"}
+        assert mode._confirm_set == frozenset({"c"})
+        assert mode == ModeDefinition(
+            name="m", safe_tools=["a"], warn_tools=["b"], confirm_tools=["c"]
+        )
+
+    def test_policy_precedence_for_tools_listed_twice(self) -> None:
+        mode = ModeDefinition(
+            name="m",
+            safe_tools=["a"],
+            block_tools=["a", "b"],
+            confirm_tools=["b", "c"],
+            warn_tools=["c", "d"],
+        )
+        assert mode._policy == {"a": "safe", "b": "block", "c": "confirm", "d": "warn"}
+
+    @pytest.mark.asyncio
+    async def test_confirm_tools_published_for_approval_hook(
+        self, tmp_path: Path
+    ) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        (modes_dir / "gated.md").write_text(
+            "---\nmode:\n  name: gated\n  tools:\n    confirm: [bash]\n---\nBody\n",
+            encoding="utf-8",
+        )
+
+        coordinator = _make_coordinator(active_mode="gated")
+        hooks = ModeHooks(coordinator, ModeDiscovery(search_paths=[modes_dir]))
+
+        result = await hooks.handle_tool_pre("tool:pre", {"tool_name": "bash"})
+        assert result.action == "continue"
+        assert "bash" in coordinator.session_state["require_approval_tools"]
+
+    @pytest.mark.asyncio
+    async def test_warn_tool_denied_once_then_allowed(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        (modes_dir / "careful.md").write_text(
+            "---\nmode:\n  name: careful\n  tools:\n    warn: [bash]\n---\nBody\n",
+            encoding="utf-8",
+        )
+
+        coordinator = _make_coordinator(active_mode="careful")
+        hooks = ModeHooks(coordinator, ModeDiscovery(search_paths=[modes_dir]))
+
+        first = await hooks.handle_tool_pre("tool:pre", {"tool_name": "bash"})
+        second = await hooks.handle_tool_pre("tool:pre", {"tool_name": "bash"})
+        assert first.action == "deny"
+        assert second.action == "continue"
+        assert hooks.warned_tools == {"careful:bash"}
+
+
+class TestActiveModeMemo:
+    """_get_active_mode reuses its last resolution until active_mode changes."""
+
+    def test_same_mode_not_resolved_twice(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file(modes_dir, "plan")
+        _create_mode_file(modes_dir, "review")
+
+        coordinator = _make_coordinator(active_mode="plan")
+        discovery = ModeDiscovery(search_paths=[modes_dir])
+        hooks = ModeHooks(coordinator, discovery)
+
+        first = hooks._get_active_mode()
+        discovery.find = MagicMock(side_effect=AssertionError("re-resolved"))
+        assert hooks._get_active_mode() is first
+
+        del discovery.find  # restore the real method
+        coordinator.session_state["active_mode"] = "review"
+        mode = hooks._get_active_mode()
+        assert mode is not None
+        assert mode.name == "review"
+
+    def test_cleared_discovery_cache_forces_resolve(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file(modes_dir, "plan")
+
+        coordinator = _make_coordinator(active_mode="plan")
+        discovery = ModeDiscovery(search_paths=[modes_dir])
+        hooks = ModeHooks(coordinator, discovery)
+
+        first = hooks._get_active_mode()
+        discovery.clear_cache()
+        second = hooks._get_active_mode()
+        assert second is not None
+        assert second is not first
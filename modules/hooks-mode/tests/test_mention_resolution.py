@@ -182,3 +182,99 @@ class TestMentionResolution:
         assert "@superpowers:context/nonexistent.md" not in content, (
             "The unresolvable @-mention line must be removed from the injected context"
         )
+
+    @pytest.mark.asyncio
+    async def test_rendered_context_reused_across_requests(
+        self, tmp_path: Path
+    ) -> None:
+        """Mentions are resolved once per mode definition, not on every request."""
+        context_file = tmp_path / "ctx.md"
+        context_file.write_text("Resolved body.", encoding="utf-8")
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file(modes_dir, "debug", body="@superpowers:ctx.md")
+
+        coordinator = _make_coordinator(active_mode="debug")
+        resolver = MagicMock()
+        resolver.resolve = MagicMock(return_value=str(context_file))
+        coordinator.get_capability = MagicMock(
+            side_effect=lambda key: resolver if key == "mention_resolver" else None
+        )
+        hooks = ModeHooks(coordinator, ModeDiscovery(search_paths=[modes_dir]))
+
+        first = await hooks.handle_provider_request("provider:request", {})
+        second = await hooks.handle_provider_request("provider:request", {})
+        assert first.context_injection == second.context_injection
+        assert "Resolved body." in second.context_injection
+        resolver.resolve.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mentions_resolved_once_resolver_appears(
+        self, tmp_path: Path
+    ) -> None:
+        """Output rendered before mention_resolver exists must not be cached."""
+        context_file = tmp_path / "ctx.md"
+        context_file.write_text("Resolved body.", encoding="utf-8")
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file(modes_dir, "debug", body="@superpowers:ctx.md")
+
+        coordinator = _make_coordinator(active_mode="debug")
+        hooks = ModeHooks(coordinator, ModeDiscovery(search_paths=[modes_dir]))
+        early = await hooks.handle_provider_request("provider:request", {})
+        assert "Resolved body." not in early.context_injection
+
+        resolver = MagicMock()
+        resolver.resolve = MagicMock(return_value=str(context_file))
+        coordinator.get_capability = MagicMock(
+            side_effect=lambda key: resolver if key == "mention_resolver" else None
+        )
+        later = await hooks.handle_provider_request("provider:request", {})
+        assert "Resolved body." in later.context_injection
+
+    @pytest.mark.asyncio
+    async def test_failed_mention_not_cached(self, tmp_path: Path) -> None:
+        """A transient resolution failure must not drop the context for good."""
+        context_file = tmp_path / "ctx.md"
+        context_file.write_text("Resolved body.", encoding="utf-8")
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file(modes_dir, "debug", body="@superpowers:ctx.md")
+
+        coordinator = _make_coordinator(active_mode="debug")
+        resolver = MagicMock()
+        resolver.resolve = MagicMock(side_effect=[None, str(context_file)])
+        coordinator.get_capability = MagicMock(
+            side_effect=lambda key: resolver if key == "mention_resolver" else None
+        )
+        hooks = ModeHooks(coordinator, ModeDiscovery(search_paths=[modes_dir]))
+
+        failed = await hooks.handle_provider_request("provider:request", {})
+        assert "Resolved body." not in failed.context_injection
+        retried = await hooks.handle_provider_request("provider:request", {})
+        assert "Resolved body." in retried.context_injection
+
+    @pytest.mark.asyncio
+    async def test_edited_mention_file_rerendered(self, tmp_path: Path) -> None:
+        """Edits to an @-mentioned file show up in the next injection."""
+        context_file = tmp_path / "ctx.md"
+        context_file.write_text("Resolved body.", encoding="utf-8")
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file(modes_dir, "debug", body="@superpowers:ctx.md")
+
+        coordinator = _make_coordinator(active_mode="debug")
+        resolver = MagicMock()
+        resolver.resolve = MagicMock(return_value=str(context_file))
+        coordinator.get_capability = MagicMock(
+            side_effect=lambda key: resolver if key == "mention_resolver" else None
+        )
+        hooks = ModeHooks(coordinator, ModeDiscovery(search_paths=[modes_dir]))
+
+        first = await hooks.handle_provider_request("provider:request", {})
+        assert "Resolved body." in first.context_injection
+
+        context_file.write_text("Edited body, now longer.", encoding="utf-8")
+        second = await hooks.handle_provider_request("provider:request", {})
+        assert "Edited body, now longer." in second.context_injection
+        assert resolver.resolve.call_count == 2
@@ -7,12 +7,45 @@ Requires hooks-mode to be mounted (reads session_state["mode_discovery"]).
 from __future__ import annotations
 
 import logging
-from typing import Any
+import sys
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 logger = logging.getLogger(__name__)
 
 __amplifier_module_type__ = "tool"
 
+# gate_policy resolved once at construction. Unrecognized policies gate
+# nothing, the same as "auto".
+_GATE_AUTO, _GATE_WARN, _GATE_CONFIRM = 0, 1, 2
+_GATE_POLICIES = {"auto": _GATE_AUTO, "warn": _GATE_WARN, "confirm": _GATE_CONFIRM}
+
+# Output of a clear when no mode was active; copied for each result
+_EMPTY_CLEAR_OUTPUT: dict[str, Any] = {
+    "status": "cleared",
+    "previous_mode": None,
+    "message": "Mode deactivated. All tools are now unrestricted.",
+}
+
+# Seconds a "warn" refusal keeps letting the retry through (warn_ttl_seconds)
+_DEFAULT_WARN_TTL = 600.0
+
+# user_instruction for a refused 'set', by gate; filled with name/description
+_SET_DENIED_TEMPLATES = {
+    _GATE_WARN: (
+        "Inform the user: I'd like to switch to '{name}' mode "
+        "({description}). You can switch manually with "
+        "/mode {name} or I can retry to proceed."
+    ),
+    _GATE_CONFIRM: (
+        "Inform the user: I'd like to switch to '{name}' mode "
+        "({description}). You can switch manually with "
+        "/mode {name} or grant permission for me to manage "
+        "mode transitions."
+    ),
+}
+
 
 class ToolResult:
     """Minimal ToolResult for when amplifier_core is not available."""
@@ -40,6 +73,19 @@ except ImportError:
     pass  # Use our minimal fallback above
 
 
+def _activation_result(output: dict[str, Any]) -> ToolResult:
+    """Wrap a cached activation output in a ToolResult the caller may edit.
+
+    ToolResult keeps the dict it is given, so the cached one is copied (with
+    its nested restricted_tools dict) to keep consumers from corrupting later
+    results.
+    """
+    return ToolResult(
+        success=True,
+        output={**output, "restricted_tools": dict(output["restricted_tools"])},
+    )
+
+
 class ModeTool:
     """Tool for agent-initiated mode management.
 
@@ -61,76 +107,161 @@ class ModeTool:
         "'clear' (deactivate), 'list' (show available), 'current' (show active). "
         "Mode transitions may require confirmation depending on gate policy."
     )
+    # One dict shared by every instance: callers must not mutate it, since an
+    # edit would change the schema of every ModeTool. Kept a plain dict (not a
+    # MappingProxyType) because hosts serialize it to JSON.
+    input_schema: ClassVar[dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "enum": ["set", "clear", "list", "current"],
+                "description": "Operation to perform",
+            },
+            "name": {
+                "type": "string",
+                "description": "Mode name (required for 'set' operation)",
+            },
+        },
+        "required": ["operation"],
+    }
+    # input_schema's operation enum, for validation_errors()
+    _valid_operations: ClassVar[frozenset[str]] = frozenset(
+        input_schema["properties"]["operation"]["enum"]
+    )
 
     def __init__(self, config: dict[str, Any], coordinator: Any):
         self.config = config
         self.coordinator = coordinator
         self.gate_policy: str = config.get("gate_policy", "warn")
-        self._warned_transitions: set[str] = set()
-
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["set", "clear", "list", "current"],
-                    "description": "Operation to perform",
-                },
-                "name": {
-                    "type": "string",
-                    "description": "Mode name (required for 'set' operation)",
-                },
-            },
-            "required": ["operation"],
+        self._gate = _GATE_POLICIES.get(self.gate_policy, _GATE_AUTO)
+        # Warn-gate memory: when each mode was last refused for 'set', and when
+        # 'clear' was (time.monotonic()). A refusal older than the TTL no longer
+        # lets the retry through, so the next attempt is refused afresh.
+        warn_ttl = config.get("warn_ttl_seconds", _DEFAULT_WARN_TTL)
+        try:
+            self._warn_ttl = float(warn_ttl)
+        except (TypeError, ValueError):
+            logger.warning(
+                "tool-mode: invalid warn_ttl_seconds %r, using %s",
+                warn_ttl,
+                _DEFAULT_WARN_TTL,
+            )
+            self._warn_ttl = _DEFAULT_WARN_TTL
+        self._warned_modes: dict[str, float] = {}
+        self._clear_warned_at: float | None = None
+        # hooks-mode objects from session_state, memoized once found. A miss is
+        # not cached, so a hooks-mode that mounts after this tool is still seen.
+        self._discovery: Any = None
+        self._hooks: Any = None
+        # Activation output per mode name, reused while discovery keeps
+        # returning the same definition object (a new one means re-parsed).
+        # Never handed out directly; see _activation_result().
+        self._activation_outputs: dict[str, tuple[Any, dict[str, Any]]] = {}
+        # Refused-'set' user_instruction per mode name, on the same terms
+        self._denied_instructions: dict[str, tuple[Any, str]] = {}
+        # operation -> handler; every handler takes (input, discovery)
+        self._operations: dict[str, Callable[[dict[str, Any], Any], ToolResult]] = {
+            "list": self._handle_list,
+            "current": self._handle_current,
+            "set": self._handle_set,
+            "clear": self._handle_clear,
         }
 
     def _get_discovery(self) -> Any:
         """Get ModeDiscovery from session_state."""
-        return self.coordinator.session_state.get("mode_discovery")
+        if self._discovery is None:
+            self._discovery = self.coordinator.session_state.get("mode_discovery")
+        return self._discovery
 
     def _get_hooks(self) -> Any:
         """Get ModeHooks from session_state."""
-        return self.coordinator.session_state.get("mode_hooks")
+        if self._hooks is None:
+            self._hooks = self.coordinator.session_state.get("mode_hooks")
+        return self._hooks
+
+    @classmethod
+    def validation_errors(cls, input: Any) -> list[str]:
+        """Check input against input_schema; return the problems found.
+
+        Hand-written for this fixed schema rather than evaluating it with a
+        generic JSON Schema validator. An empty list means the input is valid.
+        execute() runs it before dispatching every call: a bad 'operation' is
+        rejected as "invalid_operation", any other problem as "invalid_input".
+        """
+        if not isinstance(input, dict):
+            return ["input must be an object"]
+        errors: list[str] = []
+        operation = input.get("operation")
+        if "operation" not in input:
+            errors.append("'operation' is required")
+        elif not isinstance(operation, str):
+            errors.append("'operation' must be a string")
+        elif operation not in cls._valid_operations:
+            errors.append(
+                f"'operation' must be one of: {', '.join(sorted(cls._valid_operations))}"
+            )
+        if "name" in input and not isinstance(input["name"], str):
+            errors.append("'name' must be a string")
+        return errors
 
     async def execute(self, input: dict[str, Any]) -> ToolResult:
         """Execute a mode operation."""
-        operation = input.get("operation", "")
+        return self._execute_sync(input)
+
+    async def execute_batch(self, inputs: list[dict[str, Any]]) -> list[ToolResult]:
+        """Execute several mode operations in order, returning one result each.
 
+        Operations run strictly sequentially, so each sees the session state
+        left by the ones before it (e.g. 'current' after 'set'). A failed
+        operation does not stop the rest.
+        """
+        discovery = self._get_discovery()
+        if discovery is None:
+            return [self._not_mounted() for _ in inputs]
+        return [self._dispatch(input, discovery) for input in inputs]
+
+    def _execute_sync(self, input: dict[str, Any]) -> ToolResult:
+        """Body of execute(). No operation awaits anything, so it runs inline."""
         # Validate hooks-mode is mounted
         discovery = self._get_discovery()
         if discovery is None:
-            return ToolResult(
-                success=False,
-                error={
-                    "code": "hooks_mode_not_mounted",
-                    "message": (
-                        "hooks-mode module is not mounted. "
-                        "tool-mode requires hooks-mode to be mounted first. "
-                        "Add hooks-mode to your behavior's hooks section."
-                    ),
-                },
-            )
+            return self._not_mounted()
+        return self._dispatch(input, discovery)
 
-        if operation == "list":
-            return await self._handle_list(discovery)
-        elif operation == "current":
-            return await self._handle_current(discovery)
-        elif operation == "set":
-            return await self._handle_set(input, discovery)
-        elif operation == "clear":
-            return await self._handle_clear()
-        else:
+    def _not_mounted(self) -> ToolResult:
+        """Error result for when hooks-mode has not published its discovery."""
+        return ToolResult(
+            success=False,
+            error={
+                "code": "hooks_mode_not_mounted",
+                "message": (
+                    "hooks-mode module is not mounted. "
+                    "tool-mode requires hooks-mode to be mounted first. "
+                    "Add hooks-mode to your behavior's hooks section."
+                ),
+            },
+        )
+
+    def _dispatch(self, input: dict[str, Any], discovery: Any) -> ToolResult:
+        """Validate one operation's input and route it to its handler."""
+        errors = self.validation_errors(input)
+        if errors:
+            operation = input.get("operation") if isinstance(input, dict) else None
+            # A missing, non-string or unknown operation keeps its own code
+            known = isinstance(operation, str) and operation in self._operations
+            code = (
+                "invalid_input"
+                if known or not isinstance(input, dict)
+                else "invalid_operation"
+            )
             return ToolResult(
                 success=False,
-                error={
-                    "code": "invalid_operation",
-                    "message": f"Unknown operation '{operation}'. Use: set, clear, list, current",
-                },
+                error={"code": code, "message": "; ".join(errors)},
             )
+        return self._operations[input["operation"]](input, discovery)
 
-    async def _handle_list(self, discovery: Any) -> ToolResult:
+    def _handle_list(self, input: dict[str, Any], discovery: Any) -> ToolResult:
         """List all available modes."""
         modes_list = discovery.list_modes()
         active = self.coordinator.session_state.get("active_mode")
@@ -145,7 +276,7 @@ class ModeTool:
             },
         )
 
-    async def _handle_current(self, discovery: Any) -> ToolResult:
+    def _handle_current(self, input: dict[str, Any], discovery: Any) -> ToolResult:
         """Show the currently active mode."""
         active = self.coordinator.session_state.get("active_mode")
         if not active:
@@ -180,7 +311,7 @@ class ModeTool:
             },
         )
 
-    async def _handle_set(self, input: dict[str, Any], discovery: Any) -> ToolResult:
+    def _handle_set(self, input: dict[str, Any], discovery: Any) -> ToolResult:
         """Activate a mode (subject to gate policy)."""
         name = input.get("name")
         if not name:
@@ -195,18 +326,19 @@ class ModeTool:
         # Validate mode exists
         mode_def = discovery.find(name)
         if not mode_def:
-            available = discovery.list_modes()
+            # Names only: list_modes() would parse every mode file for this hint
             return ToolResult(
                 success=False,
                 error={
                     "code": "mode_not_found",
                     "message": f"Mode '{name}' not found.",
-                    "available_modes": [n for n, _d, _s in available],
+                    "available_modes": discovery.list_mode_names(),
                 },
             )
 
-        # Check allowed_transitions from current mode (if any)
         current_mode_name = self.coordinator.session_state.get("active_mode")
+
+        # Check allowed_transitions from current mode (if any)
         if current_mode_name:
             current_mode_def = discovery.find(current_mode_name) if discovery else None
             if (
@@ -226,83 +358,93 @@ class ModeTool:
                     },
                 )
 
+        # Re-setting the active mode under auto is a no-op: replay the output
+        # of the activation still in effect. Only after the transition check,
+        # so the replay skips work, never policy.
+        if self._gate == _GATE_AUTO and name == current_mode_name:
+            cached = self._activation_outputs.get(name)
+            if cached is not None and cached[0] is mode_def:
+                return _activation_result(cached[1])
+
         # Apply gate policy
-        if self.gate_policy == "warn":
-            warn_key = f"set:{name}"
-            if warn_key not in self._warned_transitions:
-                self._warned_transitions.add(warn_key)
-                return ToolResult(
-                    success=False,
-                    output={
-                        "status": "denied",
-                        "denied_mode": name,
-                        "user_instruction": (
-                            f"Inform the user: I'd like to switch to '{name}' mode "
-                            f"({mode_def.description}). You can switch manually with "
-                            f"/mode {name} or I can retry to proceed."
-                        ),
-                    },
-                )
+        if self._gate == _GATE_WARN:
+            now = time.monotonic()
+            warned_at = self._warned_modes.get(name)
+            if warned_at is None or now - warned_at > self._warn_ttl:
+                self._warned_modes[name] = now
+                return self._set_denied(name, mode_def)
 
-        elif self.gate_policy == "confirm":
-            return ToolResult(
-                success=False,
-                output={
-                    "status": "denied",
-                    "denied_mode": name,
-                    "user_instruction": (
-                        f"Inform the user: I'd like to switch to '{name}' mode "
-                        f"({mode_def.description}). You can switch manually with "
-                        f"/mode {name} or grant permission for me to manage "
-                        f"mode transitions."
-                    ),
-                },
-            )
+        elif self._gate == _GATE_CONFIRM:
+            return self._set_denied(name, mode_def)
 
         # Gate passed (auto, or warn retry) - activate the mode
         return self._activate_mode(name, mode_def)
 
+    def _set_denied(self, name: str, mode_def: Any) -> ToolResult:
+        """Refuse a 'set' under the warn or confirm gate."""
+        cached = self._denied_instructions.get(name)
+        if cached is not None and cached[0] is mode_def:
+            instruction = cached[1]
+        else:
+            instruction = _SET_DENIED_TEMPLATES[self._gate].format(
+                name=name, description=mode_def.description
+            )
+            self._denied_instructions[name] = (mode_def, instruction)
+        return ToolResult(
+            success=False,
+            output={
+                "status": "denied",
+                "denied_mode": name,
+                "user_instruction": instruction,
+            },
+        )
+
     def _activate_mode(self, name: str, mode_def: Any) -> ToolResult:
         """Activate a mode: update session state, reset warnings, return info."""
-        self.coordinator.session_state["active_mode"] = name
+        # Interned so hooks-mode's per-request lookups by this key hit the
+        # dict identity fast path (discovery interns its cache keys too)
+        self.coordinator.session_state["active_mode"] = sys.intern(name)
 
         # Reset tool warnings for the new mode
         hooks = self._get_hooks()
         if hooks:
             hooks.reset_warnings()
 
-        # Build restricted tools summary
-        restricted: dict[str, list[str]] = {}
-        if mode_def.warn_tools:
-            restricted["warn"] = mode_def.warn_tools
-        if mode_def.confirm_tools:
-            restricted["confirm"] = mode_def.confirm_tools
-        if mode_def.block_tools:
-            restricted["block"] = mode_def.block_tools
-
         logger.info("Mode activated: %s (gate_policy=%s)", name, self.gate_policy)
 
-        return ToolResult(
-            success=True,
-            output={
-                "status": "activated",
-                "mode": name,
-                "description": mode_def.description,
-                "safe_tools": mode_def.safe_tools,
-                "restricted_tools": restricted,
-                "default_action": mode_def.default_action,
-                "note": "Your available tools have changed. Review tool policies before proceeding.",
-            },
-        )
+        cached = self._activation_outputs.get(name)
+        if cached is not None and cached[0] is mode_def:
+            return _activation_result(cached[1])
 
-    async def _handle_clear(self) -> ToolResult:
+        # Build restricted tools summary
+        restricted: dict[str, list[str]] = {
+            action: tools
+            for action, tools in (
+                ("warn", mode_def.warn_tools),
+                ("confirm", mode_def.confirm_tools),
+                ("block", mode_def.block_tools),
+            )
+            if tools
+        }
+        output = {
+            "status": "activated",
+            "mode": name,
+            "description": mode_def.description,
+            "safe_tools": mode_def.safe_tools,
+            "restricted_tools": restricted,
+            "default_action": mode_def.default_action,
+            "note": "Your available tools have changed. Review tool policies before proceeding.",
+        }
+        self._activation_outputs[name] = (mode_def, output)
+        return _activation_result(output)
+
+    def _handle_clear(self, input: dict[str, Any], discovery: Any) -> ToolResult:
         """Deactivate the current mode (subject to allow_clear and gate policy)."""
         current_mode_name = self.coordinator.session_state.get("active_mode")
 
         # Check allow_clear from current mode (if any)
         if current_mode_name:
-            discovery = self._get_discovery()
-            current_mode_def = discovery.find(current_mode_name) if discovery else None
+            current_mode_def = discovery.find(current_mode_name)
             if current_mode_def and not current_mode_def.allow_clear:
                 allowed = ""
                 if current_mode_def.allowed_transitions:
@@ -320,10 +462,11 @@ class ModeTool:
                 )
 
         # Apply gate policy (same as _handle_set)
-        if self.gate_policy == "warn":
-            warn_key = "clear"
-            if warn_key not in self._warned_transitions:
-                self._warned_transitions.add(warn_key)
+        if self._gate == _GATE_WARN:
+            now = time.monotonic()
+            warned_at = self._clear_warned_at
+            if warned_at is None or now - warned_at > self._warn_ttl:
+                self._clear_warned_at = now
                 return ToolResult(
                     success=False,
                     output={
@@ -337,7 +480,7 @@ class ModeTool:
                     },
                 )
 
-        elif self.gate_policy == "confirm":
+        elif self._gate == _GATE_CONFIRM:
             return ToolResult(
                 success=False,
                 output={
@@ -362,10 +505,14 @@ class ModeTool:
             hooks.reset_warnings()
 
         # Reset gate warning memory so next set requires fresh confirmation
-        self._warned_transitions.clear()
+        self._warned_modes.clear()
+        self._clear_warned_at = None
 
         logger.info("Mode cleared (was: %s)", previous)
 
+        if previous is None:
+            # Fresh result and dict each time: ToolResult keeps what it is given
+            return ToolResult(success=True, output=dict(_EMPTY_CLEAR_OUTPUT))
         return ToolResult(
             success=True,
             output={
@@ -381,6 +528,8 @@ async def mount(coordinator: Any, config: dict[str, Any] | None = None) -> None:
 
     Config:
         gate_policy: "auto" | "warn" | "confirm" (default: "warn")
+        warn_ttl_seconds: How long a "warn" refusal lets the retry through
+            (default: 600)
     """
     config = config or {}
 
@@ -3,10 +3,42 @@
 from __future__ import annotations
 
 import textwrap
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
+from amplifier_module_hooks_mode import ModeDiscovery
+
+import amplifier_module_tool_mode
+from amplifier_module_tool_mode import ModeTool, mount
+
+ModesDirFactory = Callable[[list[str]], Path]
+
+
+class FakeHooks:
+    """Minimal stand-in for ModeHooks that counts reset_warnings() calls."""
+
+    def __init__(self) -> None:
+        self.reset_count = 0
+
+    def reset_warnings(self) -> None:
+        self.reset_count += 1
+
+
+@dataclass
+class FakeCoordinator:
+    """Plain coordinator double: session_state plus a recording async mount()."""
+
+    session_state: dict[str, Any] = field(default_factory=dict)
+    mount_calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = field(
+        default_factory=list
+    )
+
+    async def mount(self, *args: Any, **kwargs: Any) -> None:
+        self.mount_calls.append((args, kwargs))
 
 
 def _create_mode_file(path: Path, name: str, description: str = "") -> Path:
@@ -64,41 +96,59 @@ def _create_mode_file_with_transitions(
     return mode_file
 
 
+# One ModeDiscovery per modes directory; only session_state is per-test.
+_DISCOVERIES: dict[Path, Any] = {}
+
+
 def _make_coordinator(
-    tmp_path: Path,
-    mode_names: list[str] | None = None,
+    modes_dir: Path,
     active_mode: str | None = None,
-) -> MagicMock:
-    """Create a mock coordinator with mode_discovery and mode_hooks in session_state."""
-    from amplifier_module_hooks_mode import ModeDiscovery
+) -> FakeCoordinator:
+    """Create a fake coordinator from an already-populated modes directory."""
+    discovery = _DISCOVERIES.get(modes_dir)
+    if discovery is None:
+        discovery = _DISCOVERIES[modes_dir] = ModeDiscovery(search_paths=[modes_dir])
+
+    return FakeCoordinator(
+        session_state={
+            "active_mode": active_mode,
+            "mode_discovery": discovery,
+            "mode_hooks": FakeHooks(),
+        }
+    )
+
 
-    modes_dir = tmp_path / "modes"
-    modes_dir.mkdir(exist_ok=True)
-    for name in mode_names or []:
-        _create_mode_file(modes_dir, name, f"{name} mode")
+@pytest.fixture(scope="module")
+def modes_dir_factory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ModesDirFactory:
+    """Return a factory of read-only modes directories shared across the module.
 
-    discovery = ModeDiscovery(search_paths=[modes_dir])
+    Directories are keyed by mode-name set, so tests asking for the same modes
+    reuse one set of files. Tests that modify mode files must use ``tmp_path``.
+    """
+    cache: dict[tuple[str, ...], Path] = {}
 
-    hooks = MagicMock()
-    hooks.reset_warnings = MagicMock()
+    def make(names: list[str]) -> Path:
+        key = tuple(sorted(names))
+        if key not in cache:
+            modes_dir = tmp_path_factory.mktemp("modes")
+            for name in key:
+                _create_mode_file(modes_dir, name, f"{name} mode")
+            cache[key] = modes_dir
+        return cache[key]
 
-    coordinator = MagicMock()
-    coordinator.session_state = {
-        "active_mode": active_mode,
-        "mode_discovery": discovery,
-        "mode_hooks": hooks,
-    }
-    return coordinator
+    return make
 
 
 class TestModeToolList:
     """Tests for mode(operation='list')."""
 
     @pytest.mark.asyncio
-    async def test_list_returns_available_modes(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan", "review"])
+    async def test_list_returns_available_modes(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan", "review"]))
         tool = ModeTool(config={}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "list"})
@@ -108,10 +158,10 @@ class TestModeToolList:
         assert "review" in names
 
     @pytest.mark.asyncio
-    async def test_list_empty_when_no_modes(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, [])
+    async def test_list_empty_when_no_modes(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory([]))
         tool = ModeTool(config={}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "list"})
@@ -123,10 +173,10 @@ class TestModeToolCurrent:
     """Tests for mode(operation='current')."""
 
     @pytest.mark.asyncio
-    async def test_current_when_active(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"], active_mode="plan")
+    async def test_current_when_active(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]), active_mode="plan")
         tool = ModeTool(config={}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "current"})
@@ -135,10 +185,8 @@ class TestModeToolCurrent:
         assert "description" in result.output
 
     @pytest.mark.asyncio
-    async def test_current_when_none(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"], active_mode=None)
+    async def test_current_when_none(self, modes_dir_factory: ModesDirFactory) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]), active_mode=None)
         tool = ModeTool(config={}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "current"})
@@ -150,10 +198,10 @@ class TestModeToolSet:
     """Tests for mode(operation='set')."""
 
     @pytest.mark.asyncio
-    async def test_set_auto_policy_activates_immediately(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan", "review"])
+    async def test_set_auto_policy_activates_immediately(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan", "review"]))
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "plan"})
@@ -163,10 +211,10 @@ class TestModeToolSet:
         assert coordinator.session_state["active_mode"] == "plan"
 
     @pytest.mark.asyncio
-    async def test_set_returns_tool_policies(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+    async def test_set_returns_tool_policies(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "plan"})
@@ -175,32 +223,85 @@ class TestModeToolSet:
         assert "read_file" in result.output["safe_tools"]
 
     @pytest.mark.asyncio
-    async def test_set_resets_warnings(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
+    async def test_set_output_not_shared_between_results(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan", "review"]))
+        tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
+
+        first = await tool.execute({"operation": "set", "name": "plan"})
+        first.output["status"] = "tampered"
+        first.output["restricted_tools"].clear()
 
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+        await tool.execute({"operation": "set", "name": "review"})
+        again = await tool.execute({"operation": "set", "name": "plan"})
+        assert again.output["status"] == "activated"
+        assert again.output["restricted_tools"] == {"warn": ["bash"]}
+
+    @pytest.mark.asyncio
+    async def test_set_output_follows_redefined_mode(self, tmp_path: Path) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file(modes_dir, "plan", "plan mode")
+        coordinator = _make_coordinator(modes_dir)
+        tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
+
+        result = await tool.execute({"operation": "set", "name": "plan"})
+        assert result.output["description"] == "plan mode"
+        assert result.output["restricted_tools"] == {"warn": ["bash"]}
+        again = await tool.execute({"operation": "set", "name": "plan"})
+        assert again.output == result.output
+
+        _create_mode_file(modes_dir, "plan", "Redefined plan")
+        coordinator.session_state["mode_discovery"].clear_cache()
+        result = await tool.execute({"operation": "set", "name": "plan"})
+        assert result.output["description"] == "Redefined plan"
+
+    @pytest.mark.asyncio
+    async def test_set_resets_warnings(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         await tool.execute({"operation": "set", "name": "plan"})
-        coordinator.session_state["mode_hooks"].reset_warnings.assert_called_once()
+        assert coordinator.session_state["mode_hooks"].reset_count == 1
 
     @pytest.mark.asyncio
-    async def test_set_invalid_mode_rejected(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
+    async def test_set_active_mode_again_is_noop(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        # Activated outside the tool (e.g. /mode plan): first set does the work
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]), active_mode="plan")
+        tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
+        hooks = coordinator.session_state["mode_hooks"]
+
+        first = await tool.execute({"operation": "set", "name": "plan"})
+        assert hooks.reset_count == 1
 
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+        again = await tool.execute({"operation": "set", "name": "plan"})
+        assert again.success is True
+        assert again.output == first.output
+        assert hooks.reset_count == 1
+
+    @pytest.mark.asyncio
+    async def test_set_invalid_mode_rejected(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "nonexistent"})
         assert result.success is False
         assert result.error is not None
         assert result.error["code"] == "mode_not_found"
+        assert result.error["available_modes"] == ["plan"]
 
     @pytest.mark.asyncio
-    async def test_set_missing_name_rejected(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+    async def test_set_missing_name_rejected(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set"})
@@ -210,11 +311,9 @@ class TestModeToolSet:
 
     @pytest.mark.asyncio
     async def test_set_warn_policy_denies_first_allows_second(
-        self, tmp_path: Path
+        self, modes_dir_factory: ModesDirFactory
     ) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={"gate_policy": "warn"}, coordinator=coordinator)
 
         # First call: denied with warning
@@ -231,12 +330,43 @@ class TestModeToolSet:
         assert coordinator.session_state["active_mode"] == "plan"
 
     @pytest.mark.asyncio
-    async def test_set_warn_policy_resets_on_different_mode(
-        self, tmp_path: Path
+    async def test_set_warn_expires_after_ttl(
+        self, modes_dir_factory: ModesDirFactory, monkeypatch
     ) -> None:
-        from amplifier_module_tool_mode import ModeTool
+        clock = [1000.0]
+        fake_time = SimpleNamespace(monotonic=lambda: clock[0])
+        monkeypatch.setattr(amplifier_module_tool_mode, "time", fake_time)
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
+        tool = ModeTool(
+            config={"gate_policy": "warn", "warn_ttl_seconds": 60},
+            coordinator=coordinator,
+        )
+
+        await tool.execute({"operation": "set", "name": "plan"})  # denied
+        clock[0] += 61
+        result = await tool.execute({"operation": "set", "name": "plan"})
+        assert result.output["status"] == "denied"  # stale warning, refused again
+        clock[0] += 30
+        result = await tool.execute({"operation": "set", "name": "plan"})
+        assert result.output["status"] == "activated"
+
+    def test_warn_ttl_config_coerced(self, caplog) -> None:
+        coordinator = FakeCoordinator()
+        tool = ModeTool(config={"warn_ttl_seconds": "30"}, coordinator=coordinator)
+        assert tool._warn_ttl == 30.0
 
-        coordinator = _make_coordinator(tmp_path, ["plan", "review"])
+        with caplog.at_level("WARNING", logger="amplifier_module_tool_mode"):
+            tool = ModeTool(
+                config={"warn_ttl_seconds": "soon"}, coordinator=coordinator
+            )
+        assert tool._warn_ttl == 600.0
+        assert "warn_ttl_seconds" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_set_warn_policy_resets_on_different_mode(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan", "review"]))
         tool = ModeTool(config={"gate_policy": "warn"}, coordinator=coordinator)
 
         # Warn for plan
@@ -249,10 +379,10 @@ class TestModeToolSet:
         assert result2.output["denied_mode"] == "review"
 
     @pytest.mark.asyncio
-    async def test_set_confirm_policy_always_denies(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+    async def test_set_confirm_policy_always_denies(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={"gate_policy": "confirm"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "plan"})
@@ -261,49 +391,84 @@ class TestModeToolSet:
         # Confirm policy should instruct user about /mode command
         assert "user_instruction" in result.output
 
+    @pytest.mark.asyncio
+    async def test_set_denied_instruction_follows_redefined_mode(
+        self, tmp_path: Path
+    ) -> None:
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file(modes_dir, "plan", "plan mode")
+        coordinator = _make_coordinator(modes_dir)
+        tool = ModeTool(config={"gate_policy": "confirm"}, coordinator=coordinator)
+
+        result = await tool.execute({"operation": "set", "name": "plan"})
+        assert result.output["user_instruction"] == (
+            "Inform the user: I'd like to switch to 'plan' mode (plan mode). "
+            "You can switch manually with /mode plan or grant permission for me "
+            "to manage mode transitions."
+        )
+        again = await tool.execute({"operation": "set", "name": "plan"})
+        assert again.output == result.output
+
+        _create_mode_file(modes_dir, "plan", "Redefined plan")
+        coordinator.session_state["mode_discovery"].clear_cache()
+        result = await tool.execute({"operation": "set", "name": "plan"})
+        assert "(Redefined plan)" in result.output["user_instruction"]
+
 
 class TestModeToolClear:
     """Tests for mode(operation='clear')."""
 
     @pytest.mark.asyncio
-    async def test_clear_deactivates_mode(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"], active_mode="plan")
+    async def test_clear_deactivates_mode(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]), active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "clear"})
         assert result.success is True
         assert result.output["status"] == "cleared"
+        assert result.output["previous_mode"] == "plan"
         assert coordinator.session_state["active_mode"] is None
 
     @pytest.mark.asyncio
-    async def test_clear_resets_warnings(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"], active_mode="plan")
+    async def test_clear_resets_warnings(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]), active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         await tool.execute({"operation": "clear"})
-        coordinator.session_state["mode_hooks"].reset_warnings.assert_called()
+        assert coordinator.session_state["mode_hooks"].reset_count >= 1
 
     @pytest.mark.asyncio
-    async def test_clear_when_no_mode_active(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"], active_mode=None)
+    async def test_clear_when_no_mode_active(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]), active_mode=None)
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "clear"})
         assert result.success is True
         assert result.output["status"] == "cleared"
+        assert result.output["previous_mode"] is None
+        assert coordinator.session_state["mode_hooks"].reset_count == 1
+
+        result.output["status"] = "tampered"
+        again = await tool.execute({"operation": "clear"})
+        assert again is not result
+        assert again.output["status"] == "cleared"
+        assert again.output["previous_mode"] is None
+        assert coordinator.session_state["mode_hooks"].reset_count == 2
 
     @pytest.mark.asyncio
-    async def test_clear_resets_warn_gate_memory(self, tmp_path: Path) -> None:
+    async def test_clear_resets_warn_gate_memory(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
         """After clearing, warn gate should require fresh confirmation."""
-        from amplifier_module_tool_mode import ModeTool
 
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={"gate_policy": "warn"}, coordinator=coordinator)
 
         # Warm up warn gate: first denied, second allowed
@@ -319,15 +484,26 @@ class TestModeToolClear:
         assert result.success is False  # Denied again
         assert result.output["status"] == "denied"
 
+    @pytest.mark.asyncio
+    async def test_clear_warning_independent_of_mode_named_clear(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["clear"]))
+        tool = ModeTool(config={"gate_policy": "warn"}, coordinator=coordinator)
+
+        await tool.execute({"operation": "set", "name": "clear"})  # denied
+        await tool.execute({"operation": "set", "name": "clear"})  # allowed
+
+        result = await tool.execute({"operation": "clear"})
+        assert result.output["status"] == "denied"
+
 
 class TestModeToolEdgeCases:
     """Edge cases and error handling."""
 
     @pytest.mark.asyncio
-    async def test_invalid_operation(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+    async def test_invalid_operation(self, modes_dir_factory: ModesDirFactory) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "invalid"})
@@ -336,10 +512,8 @@ class TestModeToolEdgeCases:
         assert result.error["code"] == "invalid_operation"
 
     @pytest.mark.asyncio
-    async def test_missing_operation(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+    async def test_missing_operation(self, modes_dir_factory: ModesDirFactory) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={}, coordinator=coordinator)
 
         result = await tool.execute({})
@@ -348,11 +522,21 @@ class TestModeToolEdgeCases:
         assert result.error["code"] == "invalid_operation"
 
     @pytest.mark.asyncio
-    async def test_hooks_mode_not_mounted(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
+    @pytest.mark.parametrize("operation", [["list"], {"a": 1}])
+    async def test_unhashable_operation(
+        self, modes_dir_factory: ModesDirFactory, operation: Any
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
+        tool = ModeTool(config={}, coordinator=coordinator)
+
+        result = await tool.execute({"operation": operation})
+        assert result.success is False
+        assert result.error is not None
+        assert result.error["code"] == "invalid_operation"
 
-        coordinator = MagicMock()
-        coordinator.session_state = {}  # No mode_discovery
+    @pytest.mark.asyncio
+    async def test_hooks_mode_not_mounted(self, tmp_path: Path) -> None:
+        coordinator = FakeCoordinator()  # No mode_discovery
         tool = ModeTool(config={}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "list"})
@@ -361,10 +545,26 @@ class TestModeToolEdgeCases:
         assert result.error["code"] == "hooks_mode_not_mounted"
 
     @pytest.mark.asyncio
-    async def test_input_schema_is_valid(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
+    async def test_hooks_mode_mounted_after_first_call(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        mounted = _make_coordinator(modes_dir_factory(["plan"]))
+        coordinator = FakeCoordinator()
+        tool = ModeTool(config={}, coordinator=coordinator)
 
-        coordinator = _make_coordinator(tmp_path, [])
+        result = await tool.execute({"operation": "list"})
+        assert result.error["code"] == "hooks_mode_not_mounted"
+
+        coordinator.session_state.update(mounted.session_state)
+        result = await tool.execute({"operation": "list"})
+        assert result.success is True
+        assert [m["name"] for m in result.output["modes"]] == ["plan"]
+
+    @pytest.mark.asyncio
+    async def test_input_schema_is_valid(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory([]))
         tool = ModeTool(config={}, coordinator=coordinator)
 
         schema = tool.input_schema
@@ -373,67 +573,144 @@ class TestModeToolEdgeCases:
         assert "name" in schema["properties"]
         assert "operation" in schema["required"]
 
+    def test_validation_errors_follow_input_schema(self) -> None:
+        assert ModeTool.validation_errors({"operation": "set", "name": "plan"}) == []
+        assert ModeTool.validation_errors({"operation": "list"}) == []
+        assert ModeTool.validation_errors({}) == ["'operation' is required"]
+        assert ModeTool.validation_errors({"operation": "bogus"}) == [
+            "'operation' must be one of: clear, current, list, set"
+        ]
+        assert ModeTool.validation_errors({"operation": None, "name": 3}) == [
+            "'operation' must be a string",
+            "'name' must be a string",
+        ]
+        assert ModeTool.validation_errors(["list"]) == ["input must be an object"]
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_invalid_input(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
+        tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
+
+        result = await tool.execute({"operation": "set", "name": 3})
+        assert result.success is False
+        assert result.error == {
+            "code": "invalid_input",
+            "message": "'name' must be a string",
+        }
+        assert coordinator.session_state["active_mode"] is None
+
     @pytest.mark.asyncio
-    async def test_tool_name_and_description(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
+    async def test_execute_reports_operation_errors(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
+        tool = ModeTool(config={}, coordinator=coordinator)
 
-        coordinator = _make_coordinator(tmp_path, [])
+        assert (await tool.execute({})).error == {
+            "code": "invalid_operation",
+            "message": "'operation' is required",
+        }
+        assert (await tool.execute({"operation": "bogus", "name": 3})).error == {
+            "code": "invalid_operation",
+            "message": (
+                "'operation' must be one of: clear, current, list, set; "
+                "'name' must be a string"
+            ),
+        }
+        assert (await tool.execute(["list"])).error == {  # type: ignore[arg-type]
+            "code": "invalid_input",
+            "message": "input must be an object",
+        }
+
+    @pytest.mark.asyncio
+    async def test_tool_name_and_description(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory([]))
         tool = ModeTool(config={}, coordinator=coordinator)
 
         assert tool.name == "mode"
         assert len(tool.description) > 0
 
     @pytest.mark.asyncio
-    async def test_default_gate_policy_is_warn(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import ModeTool
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
+    async def test_default_gate_policy_is_warn(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
         tool = ModeTool(config={}, coordinator=coordinator)
         assert tool.gate_policy == "warn"
 
 
+class TestModeToolBatch:
+    """Tests for execute_batch()."""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_in_order(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan", "review"]))
+        tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
+
+        results = await tool.execute_batch(
+            [
+                {"operation": "set", "name": "plan"},
+                {"operation": "current"},
+                {"operation": "bogus"},
+                {"operation": "clear"},
+            ]
+        )
+        assert [r.success for r in results] == [True, True, False, True]
+        assert results[1].output["active_mode"] == "plan"
+        assert results[2].error["code"] == "invalid_operation"
+        assert results[3].output["previous_mode"] == "plan"
+        assert coordinator.session_state["active_mode"] is None
+
+    @pytest.mark.asyncio
+    async def test_batch_hooks_mode_not_mounted(self) -> None:
+        tool = ModeTool(config={}, coordinator=FakeCoordinator())
+
+        results = await tool.execute_batch([{"operation": "list"}] * 2)
+        assert [r.error["code"] for r in results] == ["hooks_mode_not_mounted"] * 2
+
+
 class TestMount:
     """Tests for the mount() function."""
 
     @pytest.mark.asyncio
-    async def test_mount_registers_tool(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import mount
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
-        coordinator.mount = AsyncMock()
+    async def test_mount_registers_tool(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
 
         await mount(coordinator, config={"gate_policy": "auto"})
 
-        coordinator.mount.assert_called_once()
-        call_args = coordinator.mount.call_args
+        assert len(coordinator.mount_calls) == 1
+        call_args = coordinator.mount_calls[0]
         assert call_args[0][0] == "tools"  # First positional: "tools"
         tool = call_args[0][1]  # Second positional: tool instance
         assert tool.name == "mode"
         assert tool.gate_policy == "auto"
 
     @pytest.mark.asyncio
-    async def test_mount_default_config(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import mount
-
-        coordinator = _make_coordinator(tmp_path, ["plan"])
-        coordinator.mount = AsyncMock()
+    async def test_mount_default_config(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]))
 
         await mount(coordinator)
 
-        tool = coordinator.mount.call_args[0][1]
+        tool = coordinator.mount_calls[0][0][1]
         assert tool.gate_policy == "warn"  # Default
 
     @pytest.mark.asyncio
     async def test_mount_warns_if_hooks_mode_missing(self, tmp_path: Path) -> None:
-        from amplifier_module_tool_mode import mount
-
-        coordinator = MagicMock()
-        coordinator.session_state = {}  # No mode_discovery
-        coordinator.mount = AsyncMock()
+        coordinator = FakeCoordinator()  # No mode_discovery
 
         # Should not crash - just warn
         await mount(coordinator)
-        coordinator.mount.assert_called_once()
+        assert len(coordinator.mount_calls) == 1
 
 
 def _create_mode_file_with_clear_policy(
@@ -470,34 +747,12 @@ def _create_mode_file_with_clear_policy(
     return mode_file
 
 
-def _make_coordinator_with_modes_dir(
-    modes_dir: Path,
-    active_mode: str | None = None,
-) -> MagicMock:
-    """Create a mock coordinator from an already-populated modes directory."""
-    from amplifier_module_hooks_mode import ModeDiscovery
-
-    discovery = ModeDiscovery(search_paths=[modes_dir])
-
-    hooks = MagicMock()
-    hooks.reset_warnings = MagicMock()
-
-    coordinator = MagicMock()
-    coordinator.session_state = {
-        "active_mode": active_mode,
-        "mode_discovery": discovery,
-        "mode_hooks": hooks,
-    }
-    return coordinator
-
-
 class TestAllowedTransitions:
     """Tests for allowed_transitions enforcement in _handle_set."""
 
     @pytest.mark.asyncio
     async def test_allowed_transition_succeeds(self, tmp_path: Path) -> None:
         """When target mode is in allowed_transitions, transition should succeed."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
@@ -506,7 +761,7 @@ class TestAllowedTransitions:
         )
         _create_mode_file(modes_dir, "review")
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "review"})
@@ -518,7 +773,6 @@ class TestAllowedTransitions:
     @pytest.mark.asyncio
     async def test_denied_transition_returns_error(self, tmp_path: Path) -> None:
         """When target mode is NOT in allowed_transitions, return transition_denied error."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
@@ -527,7 +781,7 @@ class TestAllowedTransitions:
         )
         _create_mode_file(modes_dir, "code")
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "code"})
@@ -542,14 +796,13 @@ class TestAllowedTransitions:
     @pytest.mark.asyncio
     async def test_no_allowed_transitions_allows_any(self, tmp_path: Path) -> None:
         """When allowed_transitions is None (absent), any transition is allowed."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         _create_mode_file(modes_dir, "plan")  # No allowed_transitions field
         _create_mode_file(modes_dir, "review")
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "review"})
@@ -560,7 +813,6 @@ class TestAllowedTransitions:
     @pytest.mark.asyncio
     async def test_transition_check_before_gate_policy(self, tmp_path: Path) -> None:
         """Denied transitions get hard error even with warn gate policy."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
@@ -569,7 +821,7 @@ class TestAllowedTransitions:
         )
         _create_mode_file(modes_dir, "code")
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "warn"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "code"})
@@ -582,7 +834,6 @@ class TestAllowedTransitions:
     @pytest.mark.asyncio
     async def test_no_active_mode_allows_any(self, tmp_path: Path) -> None:
         """When no mode is active, any mode can be set (no current restrictions)."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
@@ -592,7 +843,7 @@ class TestAllowedTransitions:
         _create_mode_file(modes_dir, "code")  # NOT in plan's allowed list
 
         # active_mode=None → no current mode to enforce transitions from
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode=None)
+        coordinator = _make_coordinator(modes_dir, active_mode=None)
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "code"})
@@ -603,14 +854,13 @@ class TestAllowedTransitions:
     @pytest.mark.asyncio
     async def test_empty_allowed_transitions_locks_mode(self, tmp_path: Path) -> None:
         """When allowed_transitions is [] (empty list), no transitions are possible."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         _create_mode_file_with_transitions(modes_dir, "plan", allowed_transitions=[])
         _create_mode_file(modes_dir, "review")
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "set", "name": "review"})
@@ -620,6 +870,31 @@ class TestAllowedTransitions:
         assert result.error["code"] == "transition_denied"
         assert "(none)" in result.error["message"]
 
+    @pytest.mark.asyncio
+    async def test_reset_active_mode_not_in_its_transitions(
+        self, tmp_path: Path
+    ) -> None:
+        """Re-setting a mode that does not list itself is denied, cached or not."""
+        modes_dir = tmp_path / "modes"
+        modes_dir.mkdir()
+        _create_mode_file_with_transitions(
+            modes_dir, "plan", allowed_transitions=["review"]
+        )
+        _create_mode_file(modes_dir, "review")
+
+        coordinator = _make_coordinator(modes_dir, active_mode=None)
+        tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
+        activated = await tool.execute({"operation": "set", "name": "plan"})
+        assert activated.success is True
+
+        again = await tool.execute({"operation": "set", "name": "plan"})
+        fresh = await ModeTool(
+            config={"gate_policy": "auto"}, coordinator=coordinator
+        ).execute({"operation": "set", "name": "plan"})
+
+        assert again.error["code"] == "transition_denied"
+        assert fresh.error["code"] == "transition_denied"
+
 
 class TestModeToolClearEnforcement:
     """Tests for allow_clear enforcement and gate policy in _handle_clear."""
@@ -627,7 +902,6 @@ class TestModeToolClearEnforcement:
     @pytest.mark.asyncio
     async def test_clear_denied_when_allow_clear_false(self, tmp_path: Path) -> None:
         """Clear is denied when current mode has allow_clear: false."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
@@ -636,7 +910,7 @@ class TestModeToolClearEnforcement:
         )
         _create_mode_file(modes_dir, "review")
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "clear"})
@@ -651,13 +925,12 @@ class TestModeToolClearEnforcement:
     @pytest.mark.asyncio
     async def test_clear_allowed_when_allow_clear_true(self, tmp_path: Path) -> None:
         """Clear succeeds when current mode has allow_clear: true."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         _create_mode_file_with_clear_policy(modes_dir, "plan", allow_clear=True)
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "clear"})
@@ -667,12 +940,13 @@ class TestModeToolClearEnforcement:
         assert coordinator.session_state["active_mode"] is None
 
     @pytest.mark.asyncio
-    async def test_clear_allowed_when_allow_clear_absent(self, tmp_path: Path) -> None:
+    async def test_clear_allowed_when_allow_clear_absent(
+        self, modes_dir_factory: ModesDirFactory
+    ) -> None:
         """Clear succeeds when mode file has no allow_clear field (backward compat)."""
-        from amplifier_module_tool_mode import ModeTool
 
-        # Use original _make_coordinator which creates modes without allow_clear field
-        coordinator = _make_coordinator(tmp_path, ["plan"], active_mode="plan")
+        # modes_dir_factory creates modes without an allow_clear field
+        coordinator = _make_coordinator(modes_dir_factory(["plan"]), active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "clear"})
@@ -685,13 +959,12 @@ class TestModeToolClearEnforcement:
         self, tmp_path: Path
     ) -> None:
         """With warn gate, first clear is denied with instruction, second succeeds."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         _create_mode_file_with_clear_policy(modes_dir, "plan", allow_clear=True)
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "warn"}, coordinator=coordinator)
 
         # First clear: denied (warn gate)
@@ -710,13 +983,12 @@ class TestModeToolClearEnforcement:
     @pytest.mark.asyncio
     async def test_confirm_policy_clear_always_denied(self, tmp_path: Path) -> None:
         """With confirm gate, clear is always denied."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         _create_mode_file_with_clear_policy(modes_dir, "plan", allow_clear=True)
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "confirm"}, coordinator=coordinator)
 
         result1 = await tool.execute({"operation": "clear"})
@@ -733,13 +1005,12 @@ class TestModeToolClearEnforcement:
         self, tmp_path: Path
     ) -> None:
         """allow_clear: false always denies, even with auto gate policy."""
-        from amplifier_module_tool_mode import ModeTool
 
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         _create_mode_file_with_clear_policy(modes_dir, "plan", allow_clear=False)
 
-        coordinator = _make_coordinator_with_modes_dir(modes_dir, active_mode="plan")
+        coordinator = _make_coordinator(modes_dir, active_mode="plan")
         tool = ModeTool(config={"gate_policy": "auto"}, coordinator=coordinator)
 
         result = await tool.execute({"operation": "clear"})